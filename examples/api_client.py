@@ -1,27 +1,62 @@
 """Example API client for EuroCV HTTP service."""
 
+import mimetypes
+
 import requests
 from pathlib import Path
+from requests.adapters import HTTPAdapter, Retry
+
+try:
+    from requests_toolbelt.multipart.encoder import MultipartEncoder
+except ImportError:
+    # Optional: without requests_toolbelt, uploads are buffered by requests.
+    MultipartEncoder = None
 
 
 class EuroCVClient:
-    """Client for EuroCV API."""
-    
+    """Client for EuroCV API.
+
+    Uses a single requests.Session with connection pooling so batch
+    scripts reuse TCP/TLS connections instead of reconnecting per call.
+    """
+
     def __init__(self, base_url: str = "http://localhost:8000"):
         """Initialize client.
-        
+
         Args:
             base_url: Base URL of the API
         """
         self.base_url = base_url.rstrip("/")
-    
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.1,
+                status_forcelist=[502, 503, 504],
+            ),
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def close(self) -> None:
+        """Close the underlying session and its pooled connections."""
+        self._session.close()
+
+    def __enter__(self) -> "EuroCVClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def health_check(self) -> dict:
         """Check API health.
-        
+
         Returns:
             Health status dict
         """
-        response = requests.get(f"{self.base_url}/healthz")
+        response = self._session.get(f"{self.base_url}/healthz")
         response.raise_for_status()
         return response.json()
     
@@ -45,20 +80,42 @@ class EuroCVClient:
         Returns:
             Conversion result
         """
+        mime_type = (
+            mimetypes.guess_type(file_path)[0] or "application/octet-stream"
+        )
+
         with open(file_path, "rb") as f:
-            files = {"file": (Path(file_path).name, f)}
-            data = {
-                "locale": locale,
-                "include_photo": include_photo,
-                "output_format": output_format,
-                "use_ocr": use_ocr,
-            }
-            
-            response = requests.post(
-                f"{self.base_url}/convert",
-                files=files,
-                data=data
-            )
+            if MultipartEncoder is not None:
+                # Stream the body from disk to socket in chunks instead of
+                # buffering the whole multipart-encoded upload in memory.
+                encoder = MultipartEncoder(
+                    fields={
+                        "file": (Path(file_path).name, f, mime_type),
+                        "locale": locale,
+                        "include_photo": str(include_photo).lower(),
+                        "output_format": output_format,
+                        "use_ocr": str(use_ocr).lower(),
+                    }
+                )
+                response = self._session.post(
+                    f"{self.base_url}/convert",
+                    data=encoder,
+                    headers={"Content-Type": encoder.content_type},
+                )
+            else:
+                files = {"file": (Path(file_path).name, f, mime_type)}
+                data = {
+                    "locale": locale,
+                    "include_photo": include_photo,
+                    "output_format": output_format,
+                    "use_ocr": use_ocr,
+                }
+                response = self._session.post(
+                    f"{self.base_url}/convert",
+                    files=files,
+                    data=data
+                )
+
             response.raise_for_status()
             return response.json()
     
@@ -71,7 +128,7 @@ class EuroCVClient:
         Returns:
             Validation result
         """
-        response = requests.post(
+        response = self._session.post(
             f"{self.base_url}/validate",
             json={"data": europass_data}
         )
@@ -84,16 +141,144 @@ class EuroCVClient:
         Returns:
             Service info
         """
-        response = requests.get(f"{self.base_url}/info")
+        response = self._session.get(f"{self.base_url}/info")
+        response.raise_for_status()
+        return response.json()
+
+
+class AsyncEuroCVClient:
+    """Async client for EuroCV API built on httpx.
+
+    Pools keep-alive connections (and multiplexes over HTTP/2 when the
+    h2 extra is installed), so batch pipelines can convert many files
+    concurrently with asyncio.gather instead of blocking sequentially:
+
+        async with AsyncEuroCVClient() as client:
+            results = await asyncio.gather(*[client.convert(p) for p in paths])
+    """
+
+    def __init__(self, base_url: str = "http://localhost:8000"):
+        """Initialize client.
+
+        Args:
+            base_url: Base URL of the API
+        """
+        import httpx
+
+        try:
+            # HTTP/2 needs the optional h2 package
+            client = httpx.AsyncClient(
+                base_url=base_url.rstrip("/"),
+                http2=True,
+                timeout=httpx.Timeout(5.0, read=120.0),
+                limits=httpx.Limits(
+                    max_keepalive_connections=32, max_connections=64
+                ),
+            )
+        except ImportError:
+            client = httpx.AsyncClient(
+                base_url=base_url.rstrip("/"),
+                timeout=httpx.Timeout(5.0, read=120.0),
+                limits=httpx.Limits(
+                    max_keepalive_connections=32, max_connections=64
+                ),
+            )
+        self._client = client
+
+    async def aclose(self) -> None:
+        """Close the underlying client and its pooled connections."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncEuroCVClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def health_check(self) -> dict:
+        """Check API health.
+
+        Returns:
+            Health status dict
+        """
+        response = await self._client.get("/healthz")
+        response.raise_for_status()
+        return response.json()
+
+    async def convert(
+        self,
+        file_path: str,
+        locale: str = "en-US",
+        include_photo: bool = True,
+        output_format: str = "json",
+        use_ocr: bool = False,
+    ) -> dict:
+        """Convert a resume file.
+
+        Args:
+            file_path: Path to resume file
+            locale: Locale for formatting
+            include_photo: Include photo in output
+            output_format: Output format (json/xml/both)
+            use_ocr: Use OCR for scanned PDFs
+
+        Returns:
+            Conversion result
+        """
+        mime_type = (
+            mimetypes.guess_type(file_path)[0] or "application/octet-stream"
+        )
+
+        with open(file_path, "rb") as f:
+            response = await self._client.post(
+                "/convert",
+                files={"file": (Path(file_path).name, f, mime_type)},
+                data={
+                    "locale": locale,
+                    "include_photo": str(include_photo).lower(),
+                    "output_format": output_format,
+                    "use_ocr": str(use_ocr).lower(),
+                },
+            )
+        response.raise_for_status()
+        return response.json()
+
+    async def validate(self, europass_data: dict) -> dict:
+        """Validate Europass data.
+
+        Args:
+            europass_data: Europass JSON data
+
+        Returns:
+            Validation result
+        """
+        response = await self._client.post(
+            "/validate", json={"data": europass_data}
+        )
+        response.raise_for_status()
+        return response.json()
+
+    async def info(self) -> dict:
+        """Get service information.
+
+        Returns:
+            Service info
+        """
+        response = await self._client.get("/info")
         response.raise_for_status()
         return response.json()
 
 
 def main():
     """Example usage."""
-    # Initialize client
-    client = EuroCVClient("http://localhost:8000")
-    
+    # Initialize client (context manager closes pooled connections on exit)
+    with EuroCVClient("http://localhost:8000") as client:
+        _run_examples(client)
+
+
+def _run_examples(client):
+    """Run the example calls against a connected client."""
+
     # Check health
     print("Checking API health...")
     health = client.health_check()
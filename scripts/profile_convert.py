@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+"""Profile the conversion pipeline over a set of resume files.
+
+The converter orchestrates C-backed libraries (PyMuPDF, python-docx,
+lxml); this script exists to show where the time actually goes before
+anyone invests in rewriting the Python-level orchestration. Run it over
+a directory of representative CVs:
+
+    python scripts/profile_convert.py path/to/cvs --repeat 10
+
+It prints cProfile's cumulative-time hotspots and, when pyinstrument is
+installed, a sampling-profiler call tree as well. Enable DEBUG logging
+on eurocv.core.converter to see the cheap per-phase timers instead.
+"""
+
+import argparse
+import cProfile
+import logging
+import pstats
+import sys
+from pathlib import Path
+
+from eurocv.core.converter import convert_to_europass
+
+try:
+    from pyinstrument import Profiler
+except ImportError:
+    Profiler = None
+
+
+def find_files(root: Path) -> list[Path]:
+    """Collect the PDF and DOCX files under a directory."""
+    if root.is_file():
+        return [root]
+    return sorted(
+        p for p in root.rglob("*") if p.suffix.lower() in (".pdf", ".docx", ".doc")
+    )
+
+
+def run(files: list[Path], repeat: int) -> None:
+    """Convert every file `repeat` times."""
+    for _ in range(repeat):
+        for path in files:
+            try:
+                convert_to_europass(str(path), output_format="both")
+            except Exception as e:
+                print(f"  skipped {path.name}: {e}", file=sys.stderr)
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", type=Path, help="CV file or directory of CVs")
+    parser.add_argument(
+        "--repeat", type=int, default=1, help="Conversions per file (default: 1)"
+    )
+    parser.add_argument(
+        "--debug-phases",
+        action="store_true",
+        help="Also emit the converter's per-phase DEBUG timings",
+    )
+    args = parser.parse_args()
+
+    files = find_files(args.path)
+    if not files:
+        parser.error(f"no PDF/DOCX files found under {args.path}")
+    print(f"Profiling {len(files)} file(s) x {args.repeat} run(s)\n")
+
+    if args.debug_phases:
+        logging.basicConfig(level=logging.DEBUG)
+        logging.getLogger("eurocv.core.converter").setLevel(logging.DEBUG)
+
+    # Warm-up run so one-time costs (XSD compile, extractor instances,
+    # lazy imports) do not distort the profile.
+    run(files[:1], 1)
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    run(files, args.repeat)
+    profiler.disable()
+
+    stats = pstats.Stats(profiler)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(25)
+
+    if Profiler is not None:
+        sampler = Profiler()
+        sampler.start()
+        run(files, args.repeat)
+        sampler.stop()
+        print(sampler.output_text(unicode=True, color=False))
+    else:
+        print("pyinstrument not installed; skipping sampling profile")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,28 @@
 """EuroCV - Convert resumes to Europass format."""
 
-from eurocv.core.converter import convert_to_europass
-from eurocv.core.models import EuropassCV, Resume
+from typing import TYPE_CHECKING, Any
 
 __version__ = "0.1.0"
 __all__ = ["convert_to_europass", "Resume", "EuropassCV"]
+
+if TYPE_CHECKING:
+    from eurocv.core.converter import convert_to_europass
+    from eurocv.core.models import EuropassCV, Resume
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import the public API (PEP 562).
+
+    Importing eurocv eagerly pulled in the PDF/DOCX/lxml stack, which
+    costs hundreds of milliseconds even for `eurocv version`. Deferring
+    the imports until first attribute access keeps `import eurocv` cheap.
+    """
+    if name == "convert_to_europass":
+        from eurocv.core.converter import convert_to_europass
+
+        return convert_to_europass
+    if name in ("Resume", "EuropassCV"):
+        from eurocv.core import models
+
+        return getattr(models, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,11 +1,18 @@
 """FastAPI HTTP service for EuroCV."""
 
+import asyncio
+import functools
+import hashlib
+import io
 import tempfile
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Literal, Optional
 
-from fastapi import FastAPI, File, Form, HTTPException, UploadFile
-from fastapi.responses import JSONResponse
+import anyio.to_thread
+import orjson
+from fastapi import FastAPI, File, Form, HTTPException, Response, UploadFile
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, ConfigDict
 
 from eurocv import __version__
@@ -19,9 +26,18 @@ app = FastAPI(
     version=__version__,
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
 )
 
 
+# LRU cache of conversion responses keyed by (content hash, options).
+# Recruiting pipelines re-upload identical CVs; serving those from cache
+# skips the whole extract+map+validate pipeline.
+_CONVERT_CACHE_SIZE = 256
+_convert_cache: "OrderedDict[tuple, ConvertResponse]" = OrderedDict()
+_cache_locks: dict[tuple, asyncio.Lock] = {}
+
+
 class ConvertRequest(BaseModel):
     """Convert request parameters."""
 
@@ -57,21 +73,58 @@ class ValidateResponse(BaseModel):
     errors: list[str] = []
 
 
-@app.get("/")
-async def root() -> dict[str, str]:
-    """Root endpoint."""
-    return {
+# Static-ish payloads baked to bytes once at import: these endpoints are
+# polled frequently (k8s probes, monitoring) and should cost one send()
+_ROOT_BYTES = orjson.dumps(
+    {
         "service": "EuroCV API",
         "version": __version__,
         "docs": "/docs",
         "health": "/healthz",
     }
+)
+_HEALTH_BYTES = orjson.dumps({"status": "healthy", "version": __version__})
+_INFO_BYTES = orjson.dumps(
+    {
+        "service": "EuroCV API",
+        "version": __version__,
+        "capabilities": {
+            "input_formats": ["pdf", "docx", "doc"],
+            "output_formats": ["json", "xml"],
+            "locales": ["en-US", "nl-NL"],
+            "ocr": True,
+            "validation": True,
+        },
+        "endpoints": {
+            "convert": "/convert",
+            "validate": "/validate",
+            "schema": "/schema",
+            "health": "/healthz",
+            "docs": "/docs",
+        },
+    }
+)
+_STATIC_HEADERS = {"Cache-Control": "public, max-age=5"}
+
+
+@app.get("/")
+async def root() -> Response:
+    """Root endpoint."""
+    return Response(
+        content=_ROOT_BYTES,
+        media_type="application/json",
+        headers=_STATIC_HEADERS,
+    )
 
 
 @app.get("/healthz")
-async def health() -> dict[str, str]:
+async def health() -> Response:
     """Health check endpoint."""
-    return {"status": "healthy", "version": __version__}
+    return Response(
+        content=_HEALTH_BYTES,
+        media_type="application/json",
+        headers=_STATIC_HEADERS,
+    )
 
 
 @app.post("/convert", response_model=ConvertResponse)
@@ -182,61 +235,209 @@ async def convert(
     # Type-cast output_format after validation
     validated_format: Literal["json", "xml", "both"] = output_format  # type: ignore[assignment]
 
-    # Save uploaded file to temporary location
+    tmp_path: Optional[str] = None
     try:
-        with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as tmp_file:
-            content = await file.read()
-            tmp_file.write(content)
-            tmp_path = tmp_file.name
-
-        # Convert
-        result = convert_to_europass(
-            tmp_path,
-            locale=locale,
-            include_photo=include_photo,
-            output_format=validated_format,
-            use_ocr=use_ocr,
-            validate=validate,
+        hasher = hashlib.blake2b()
+        source: Any
+        if use_ocr:
+            # OCR may shell out to tools that need a real path: spool the
+            # upload to a temp file, streaming in chunks
+            with tempfile.NamedTemporaryFile(
+                delete=False, suffix=file_ext
+            ) as tmp_file:
+                while chunk := await file.read(1 << 20):
+                    hasher.update(chunk)
+                    tmp_file.write(chunk)
+                tmp_path = tmp_file.name
+            source = tmp_path
+        else:
+            # Extractors accept file-like input, so keep the upload in
+            # memory and skip the temp-file write+read round-trip
+            buffer = io.BytesIO()
+            while chunk := await file.read(1 << 20):
+                hasher.update(chunk)
+                buffer.write(chunk)
+            buffer.seek(0)
+            buffer.name = file.filename
+            source = buffer
+
+        # Identical uploads with identical options can reuse a cached
+        # response; the per-key lock coalesces concurrent duplicates
+        cache_key = (
+            hasher.hexdigest(),
+            locale,
+            include_photo,
+            output_format,
+            use_ocr,
+            validate,
         )
-
-        # Clean up temp file
-        Path(tmp_path).unlink()
-
-        # Build response
-        if output_format == "json":
-            if isinstance(result, dict):
-                return ConvertResponse(
-                    success=True, data=result, message="Conversion successful"
-                )
-            raise HTTPException(status_code=500, detail="Expected dict for JSON output")
-        elif output_format == "xml":
-            if isinstance(result, str):
-                return ConvertResponse(
-                    success=True, xml=result, message="Conversion successful"
+        lock = _cache_locks.setdefault(cache_key, asyncio.Lock())
+        try:
+            async with lock:
+                cached = _convert_cache.get(cache_key)
+                if cached is not None:
+                    _convert_cache.move_to_end(cache_key)
+                    return cached
+
+                # Run the CPU-heavy conversion in a worker thread so the event
+                # loop stays free to service other requests meanwhile
+                result = await anyio.to_thread.run_sync(
+                    functools.partial(
+                        convert_to_europass,
+                        source,
+                        locale=locale,
+                        include_photo=include_photo,
+                        output_format=validated_format,
+                        use_ocr=use_ocr,
+                        validate=validate,
+                    )
                 )
-            raise HTTPException(status_code=500, detail="Expected str for XML output")
-        else:  # both
-            if isinstance(result, ConversionResult):
-                return ConvertResponse(
-                    success=True,
-                    data=result.json_data,
-                    xml=result.xml_data,
-                    validation_errors=result.validation_errors,
-                    message="Conversion successful",
-                )
-            raise HTTPException(
-                status_code=500, detail="Expected ConversionResult for both output"
-            )
 
+                # Build response
+                if output_format == "json":
+                    if isinstance(result, dict):
+                        response = ConvertResponse(
+                            success=True, data=result, message="Conversion successful"
+                        )
+                    else:
+                        raise HTTPException(
+                            status_code=500, detail="Expected dict for JSON output"
+                        )
+                elif output_format == "xml":
+                    if isinstance(result, str):
+                        response = ConvertResponse(
+                            success=True, xml=result, message="Conversion successful"
+                        )
+                    else:
+                        raise HTTPException(
+                            status_code=500, detail="Expected str for XML output"
+                        )
+                else:  # both
+                    if isinstance(result, ConversionResult):
+                        response = ConvertResponse(
+                            success=True,
+                            data=result.json_data,
+                            xml=result.xml_data,
+                            validation_errors=result.validation_errors,
+                            message="Conversion successful",
+                        )
+                    else:
+                        raise HTTPException(
+                            status_code=500,
+                            detail="Expected ConversionResult for both output",
+                        )
+
+                _convert_cache[cache_key] = response
+                while len(_convert_cache) > _CONVERT_CACHE_SIZE:
+                    evicted, _ = _convert_cache.popitem(last=False)
+                    _cache_locks.pop(evicted, None)
+                return response
+        finally:
+            # A conversion that raised never cached a response, so eviction
+            # will never reclaim its lock entry; drop it here instead. Keys
+            # that did cache stay until the response cache evicts them.
+            if cache_key not in _convert_cache:
+                _cache_locks.pop(cache_key, None)
+
+    except HTTPException:
+        raise
     except Exception as e:
-        # Clean up temp file on error
-        if "tmp_path" in locals():
+        raise HTTPException(status_code=500, detail=f"Conversion failed: {str(e)}")
+    finally:
+        # Always remove the temp file, even on errors or cancellation
+        if tmp_path:
             try:
                 Path(tmp_path).unlink()
-            except Exception:
+            except OSError:
                 pass
 
+
+@app.post("/convert/xml")
+async def convert_xml(
+    file: UploadFile = File(..., description="Resume file (PDF or DOCX)"),
+    locale: str = Form("en-US", description="Locale for formatting (e.g., nl-NL)"),
+    include_photo: bool = Form(True, description="Include photo in output"),
+    use_ocr: bool = Form(False, description="Use OCR for scanned PDFs"),
+    validate: bool = Form(True, description="Validate against Europass schema"),
+) -> StreamingResponse:
+    """Convert a resume file and stream the Europass XML directly.
+
+    Unlike /convert with output_format=xml, the XML is not embedded as an
+    escaped string inside a JSON envelope: it is streamed raw with
+    media type application/xml, so multi-MB documents avoid a second
+    JSON-encode pass and clients can consume them incrementally.
+    Validation errors (when requested) are reported via the
+    X-Validation-Errors response header as a JSON array.
+    """
+    if not file.filename:
+        raise HTTPException(status_code=400, detail="No file provided")
+
+    file_ext = Path(file.filename).suffix.lower()
+    if file_ext not in [".pdf", ".docx", ".doc"]:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported file format: {file_ext}. Supported: .pdf, .docx, .doc",
+        )
+
+    tmp_path: Optional[str] = None
+    try:
+        if use_ocr:
+            with tempfile.NamedTemporaryFile(
+                delete=False, suffix=file_ext
+            ) as tmp_file:
+                while chunk := await file.read(1 << 20):
+                    tmp_file.write(chunk)
+                tmp_path = tmp_file.name
+            source: Any = tmp_path
+        else:
+            buffer = io.BytesIO()
+            while chunk := await file.read(1 << 20):
+                buffer.write(chunk)
+            buffer.seek(0)
+            buffer.name = file.filename
+            source = buffer
+
+        result = await anyio.to_thread.run_sync(
+            functools.partial(
+                convert_to_europass,
+                source,
+                locale=locale,
+                include_photo=include_photo,
+                output_format="xml",
+                use_ocr=use_ocr,
+                validate=False,
+            )
+        )
+        if not isinstance(result, str):
+            raise HTTPException(status_code=500, detail="Expected str for XML output")
+
+        xml_bytes = result.encode("utf-8")
+
+        headers = {}
+        if validate:
+            _, errors = validate_europass(result)
+            headers["X-Validation-Errors"] = orjson.dumps(errors).decode("utf-8")
+
+        def iter_chunks(payload: bytes, size: int = 1 << 16):  # type: ignore[no-untyped-def]
+            for offset in range(0, len(payload), size):
+                yield payload[offset : offset + size]
+
+        return StreamingResponse(
+            iter_chunks(xml_bytes),
+            media_type="application/xml",
+            headers=headers,
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
         raise HTTPException(status_code=500, detail=f"Conversion failed: {str(e)}")
+    finally:
+        if tmp_path:
+            try:
+                Path(tmp_path).unlink()
+            except OSError:
+                pass
 
 
 @app.post("/validate", response_model=ValidateResponse)
@@ -260,26 +461,13 @@ async def validate_endpoint(request: ValidateRequest) -> ValidateResponse:
 
 
 @app.get("/info")
-async def info() -> dict[str, Any]:
+async def info() -> Response:
     """Get service information and capabilities."""
-    return {
-        "service": "EuroCV API",
-        "version": __version__,
-        "capabilities": {
-            "input_formats": ["pdf", "docx", "doc"],
-            "output_formats": ["json", "xml"],
-            "locales": ["en-US", "nl-NL"],
-            "ocr": True,
-            "validation": True,
-        },
-        "endpoints": {
-            "convert": "/convert",
-            "validate": "/validate",
-            "schema": "/schema",
-            "health": "/healthz",
-            "docs": "/docs",
-        },
-    }
+    return Response(
+        content=_INFO_BYTES,
+        media_type="application/json",
+        headers=_STATIC_HEADERS,
+    )
 
 
 @app.get("/schema")
@@ -310,6 +498,16 @@ async def get_schema() -> dict[str, Any]:
     Returns:
         JSON Schema object describing the Europass CV structure
     """
+    return _europass_json_schema()
+
+
+@functools.lru_cache(maxsize=1)
+def _europass_json_schema() -> dict[str, Any]:
+    """Build the Europass CV JSON Schema once and reuse it.
+
+    Walking the ~40 nested Pydantic models to generate the schema is
+    expensive; the result is static for the process lifetime.
+    """
     from eurocv.core.europass_schema import EuropassCVResponse
 
     return EuropassCVResponse.model_json_schema()
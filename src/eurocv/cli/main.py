@@ -1,13 +1,18 @@
 """CLI interface for EuroCV."""
 
-import json
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Literal, Optional, Union
 
+import orjson
 import typer
-from rich import print as rprint
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.progress import (
+    BarColumn,
+    Progress,
+    SpinnerColumn,
+    TaskProgressColumn,
+    TextColumn,
+)
 
 from eurocv.core.converter import convert_to_europass
 from eurocv.core.models import ConversionResult
@@ -154,10 +159,18 @@ def batch(
         eurocv batch "resumes/*.pdf" --out-dir output/
         eurocv batch "*.docx" --parallel 4 --format both
     """
-    from glob import glob
+    import os
+
+    # Find matching files via scandir-backed Path.glob (avoids the extra
+    # per-entry stat calls glob.glob pays on large directories)
+    root, pattern = os.path.split(input_pattern)
+    if not pattern or any(ch in root for ch in "*?["):
+        # Wildcards in the directory part: defer to glob.glob semantics
+        from glob import glob
 
-    # Find matching files
-    files = glob(input_pattern)
+        files = glob(input_pattern)
+    else:
+        files = [str(p) for p in Path(root or ".").glob(pattern)]
 
     if not files:
         console.print(f"[yellow]No files found matching: {input_pattern}[/yellow]")
@@ -168,54 +181,63 @@ def batch(
 
     console.print(f"[blue]Found {len(files)} file(s) to convert[/blue]")
 
-    # Process files
-    with Progress(console=console) as progress:
-        task = progress.add_task("[cyan]Converting files...", total=len(files))
+    # Process files. Low refresh rate and no per-file description updates
+    # keep the render loop off the conversion hot path.
+    with Progress(
+        TextColumn("[cyan]Converting files"),
+        BarColumn(),
+        TaskProgressColumn(),
+        console=console,
+        refresh_per_second=4,
+        transient=True,
+    ) as progress:
+        task = progress.add_task("batch", total=len(files))
 
         success_count = 0
         error_count = 0
 
-        for file_str in files:
-            file_path = Path(file_str)
-            progress.update(task, description=f"[cyan]Converting: {file_path.name}")
-
-            try:
-                # Convert
-                result = convert_to_europass(
-                    str(file_path),
-                    locale=locale,
-                    include_photo=not no_photo,
-                    output_format=format if format != "both" else "both",
-                    use_ocr=use_ocr,
-                    validate=False,  # Skip validation for batch to speed up
-                )
-
-                # Save output
-                base_name = file_path.stem
-
-                if format in ["json", "both"]:
-                    json_path = out_dir / f"{base_name}.europass.json"
-                    if format == "both" and isinstance(result, ConversionResult):
-                        if result.json_data:
-                            _save_json(result.json_data, json_path, pretty=True)
-                    elif isinstance(result, dict):
-                        _save_json(result, json_path, pretty=True)
-
-                if format in ["xml", "both"]:
-                    xml_path = out_dir / f"{base_name}.europass.xml"
-                    if format == "both" and isinstance(result, ConversionResult):
-                        if result.xml_data:
-                            _save_xml(result.xml_data, xml_path)
-                    elif isinstance(result, str):
-                        _save_xml(result, xml_path)
-
-                success_count += 1
+        if parallel > 1:
+            # Fan per-file work out to worker processes so CPU-heavy PDF
+            # parsing uses multiple cores. Workers re-import this module,
+            # so the per-file body lives in the picklable _convert_one.
+            from concurrent.futures import ProcessPoolExecutor, as_completed
+
+            with ProcessPoolExecutor(max_workers=parallel) as executor:
+                futures = [
+                    executor.submit(
+                        _convert_one,
+                        file_str,
+                        str(out_dir),
+                        locale,
+                        no_photo,
+                        use_ocr,
+                        format,
+                    )
+                    for file_str in files
+                ]
+
+                for future in as_completed(futures):
+                    file_str, ok, err = future.result()
+                    if ok:
+                        success_count += 1
+                    else:
+                        console.print(f"[red]✗[/red] {Path(file_str).name}: {err}")
+                        error_count += 1
+                    progress.advance(task)
+        else:
+            for file_str in files:
+                file_path = Path(file_str)
 
-            except Exception as e:
-                console.print(f"[red]✗[/red] {file_path.name}: {str(e)}")
-                error_count += 1
+                _, ok, err = _convert_one(
+                    file_str, str(out_dir), locale, no_photo, use_ocr, format
+                )
+                if ok:
+                    success_count += 1
+                else:
+                    console.print(f"[red]✗[/red] {file_path.name}: {err}")
+                    error_count += 1
 
-            progress.advance(task)
+                progress.advance(task)
 
     # Summary
     console.print("\n[bold]Summary:[/bold]")
@@ -240,16 +262,15 @@ def validate(
     console.print(f"[blue]Validating: {input_file}[/blue]")
 
     try:
-        with open(input_file, encoding="utf-8") as f:
-            content = f.read()
-
         validator = SchemaValidator()
 
         # Determine format
         if input_file.suffix.lower() == ".json":
-            data = json.loads(content)
+            # orjson parses straight from bytes: no intermediate str copy
+            data = orjson.loads(input_file.read_bytes())
             is_valid, errors = validator.validate_json(data)
         else:
+            content = input_file.read_text(encoding="utf-8")
             is_valid, errors = validator.validate_xml(content)
 
         if is_valid:
@@ -270,14 +291,24 @@ def serve(
     host: str = typer.Option("0.0.0.0", "--host", help="Host to bind to"),
     port: int = typer.Option(8000, "--port", "-p", help="Port to bind to"),
     reload: bool = typer.Option(False, "--reload", help="Enable auto-reload"),
+    workers: Optional[int] = typer.Option(
+        None, "--workers", "-w", help="Worker processes (default: CPU count)"
+    ),
 ) -> None:
     """Start the HTTP API server.
 
+    Uses one worker per CPU core by default (single worker with --reload)
+    and the C-accelerated uvloop/httptools stack when installed.
+
     Examples:
         eurocv serve
         eurocv serve --port 8080 --reload
+        eurocv serve --workers 4
     """
     try:
+        import os
+        from importlib.util import find_spec
+
         import uvicorn
 
         console.print(f"[blue]Starting server on {host}:{port}[/blue]")
@@ -288,6 +319,9 @@ def serve(
             host=host,
             port=port,
             reload=reload,
+            workers=1 if reload else (workers or os.cpu_count() or 1),
+            loop="uvloop" if find_spec("uvloop") else "auto",
+            http="httptools" if find_spec("httptools") else "auto",
         )
 
     except ImportError:
@@ -305,27 +339,90 @@ def version() -> None:
     console.print(f"eurocv version {__version__}")
 
 
+def _convert_one(
+    file_str: str,
+    out_dir: str,
+    locale: str,
+    no_photo: bool,
+    use_ocr: bool,
+    format: str,
+) -> tuple[str, bool, Optional[str]]:
+    """Convert a single file for batch processing.
+
+    Module-level (and picklable) so it can run in ProcessPoolExecutor
+    workers as well as inline when --parallel is 1.
+
+    Args:
+        file_str: Path to the input file
+        out_dir: Output directory path
+        locale: Locale for formatting
+        no_photo: Exclude photos from output
+        use_ocr: Use OCR for scanned PDFs
+        format: Output format (json/xml/both)
+
+    Returns:
+        Tuple of (file_str, success, error message or None)
+    """
+    file_path = Path(file_str)
+    out_path = Path(out_dir)
+
+    try:
+        result = convert_to_europass(
+            str(file_path),
+            locale=locale,
+            include_photo=not no_photo,
+            output_format=format if format != "both" else "both",
+            use_ocr=use_ocr,
+            validate=False,  # Skip validation for batch to speed up
+        )
+
+        # Save output
+        base_name = file_path.stem
+
+        if format in ["json", "both"]:
+            json_path = out_path / f"{base_name}.europass.json"
+            if format == "both" and isinstance(result, ConversionResult):
+                if result.json_data:
+                    _save_json(result.json_data, json_path, pretty=True)
+            elif isinstance(result, dict):
+                _save_json(result, json_path, pretty=True)
+
+        if format in ["xml", "both"]:
+            xml_path = out_path / f"{base_name}.europass.xml"
+            if format == "both" and isinstance(result, ConversionResult):
+                if result.xml_data:
+                    _save_xml(result.xml_data, xml_path)
+            elif isinstance(result, str):
+                _save_xml(result, xml_path)
+
+        return file_str, True, None
+
+    except Exception as e:
+        return file_str, False, str(e)
+
+
 def _save_json(data: dict, path: Path, pretty: bool = True) -> None:
-    """Save JSON data to file."""
-    with open(path, "w", encoding="utf-8") as f:
-        if pretty:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        else:
-            json.dump(data, f, ensure_ascii=False)
+    """Save JSON data to file using the C-accelerated orjson encoder."""
+    option = orjson.OPT_INDENT_2 if pretty else 0
+    # Serialize once and emit with a single write() syscall
+    path.write_bytes(orjson.dumps(data, option=option))
 
 
 def _print_json(data: dict, pretty: bool = True) -> None:
-    """Print JSON data to console."""
-    if pretty:
-        rprint(json.dumps(data, indent=2, ensure_ascii=False))
-    else:
-        rprint(json.dumps(data, ensure_ascii=False))
+    """Print JSON data to console via Rich's native JSON renderer."""
+    # Rich renders straight from the dict: one pass, no intermediate
+    # dumps-then-retokenize round trip
+    console.print_json(data=data, indent=2 if pretty else None)
 
 
-def _save_xml(data: str, path: Path) -> None:
-    """Save XML data to file."""
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(data)
+def _save_xml(data: Union[str, bytes], path: Path) -> None:
+    """Save XML data to file.
+
+    Accepts bytes directly (e.g. from lxml's serializer) so no extra
+    encode pass is needed; str input is encoded once up front.
+    """
+    payload = data if isinstance(data, bytes) else data.encode("utf-8")
+    path.write_bytes(payload)
 
 
 if __name__ == "__main__":
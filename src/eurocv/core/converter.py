@@ -1,33 +1,73 @@
 """Main converter module."""
 
+import functools
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Literal, Union
+from typing import Any, BinaryIO, Literal, Optional, Sequence, Union
 
-from eurocv.core.extract.registry import get_extractor
-from eurocv.core.map.europass_mapper import EuropassMapper
 from eurocv.core.models import ConversionResult, EuropassCV, Resume
-from eurocv.core.validate.schema_validator import SchemaValidator
+
+# The extract (PyMuPDF, python-docx, pdfminer) and validate (lxml)
+# stacks are imported lazily inside the functions that need them:
+# importing this module then costs milliseconds, which matters for
+# server cold starts and CLI --help paths that never convert anything.
+
+logger = logging.getLogger(__name__)
+
+# Small shared pool for overlapping JSON and XML validation on the
+# "both" output path; shared across conversions and joined at
+# interpreter exit, which is fine for these short-lived tasks.
+_VALIDATION_POOL = ThreadPoolExecutor(max_workers=2)
+
+
+def _log_phases(t_start: float, t_extract: float, t_map: float) -> None:
+    """Log per-phase timings of a conversion at DEBUG level.
+
+    The pipeline is dominated by the C-backed extract (PyMuPDF/python-
+    docx) and emit/validate (lxml) phases, not by Python-level
+    orchestration; these timings make that visible before anyone reaches
+    for heavier machinery. See scripts/profile_convert.py for the full
+    profiler run.
+    """
+    t_end = time.perf_counter()
+    logger.debug(
+        "convert phases: extract=%.1fms map=%.1fms emit+validate=%.1fms",
+        (t_extract - t_start) * 1000,
+        (t_map - t_extract) * 1000,
+        (t_end - t_map) * 1000,
+    )
 
 
 def convert_to_europass(
-    file_path: str,
+    file_path: Union[str, Path, BinaryIO],
     locale: str = "en-US",
     include_photo: bool = True,
     output_format: Literal["json", "xml", "both"] = "json",
     use_ocr: bool = False,
-    validate: bool = True,
+    validate: Union[bool, Literal["none", "json", "xml", "both"]] = True,
+    filename: Optional[str] = None,
 ) -> Union[dict[str, Any], str, ConversionResult]:
     """Convert a resume file to Europass format.
 
     This is the main entry point for the library.
 
     Args:
-        file_path: Path to resume file (PDF or DOCX)
+        file_path: Path to resume file (PDF or DOCX), or an open binary
+            file-like object (avoids a temp-file round-trip for uploads)
         locale: Locale for formatting (e.g., 'nl-NL', 'en-US')
         include_photo: Whether to include photo (GDPR consideration)
         output_format: Output format - 'json', 'xml', or 'both'
         use_ocr: Use OCR for scanned PDFs (requires pytesseract)
-        validate: Validate against Europass schema
+        validate: Which outputs to validate: "none", "json", "xml" or
+            "both". True picks the produced format, except for
+            output_format="both" where it checks only JSON — the XML is
+            generated from the same tree, so the XSD pass is largely
+            redundant there; pass validate="both" to force it.
+            False is equivalent to "none".
+        filename: Original filename, used for format detection when
+            file_path is a file-like object without a usable .name
 
     Returns:
         Europass JSON dict if output_format='json',
@@ -37,58 +77,152 @@ def convert_to_europass(
         FileNotFoundError: If file doesn't exist
         ValueError: If file format is unsupported
     """
-    path = Path(file_path)
+    if hasattr(file_path, "read"):
+        source: Union[str, BinaryIO] = file_path
+    else:
+        # Reuse the caller's Path/str instead of round-tripping through
+        # a fresh PurePath parse and str() per call.
+        path = file_path if isinstance(file_path, Path) else Path(file_path)
+
+        if not path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        source = file_path if isinstance(file_path, str) else str(path)
 
-    if not path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
+    t_start = time.perf_counter()
 
     # Step 1: Extract resume data
-    resume = extract_resume(str(path), use_ocr=use_ocr)
+    resume = extract_resume(source, use_ocr=use_ocr, filename=filename)
+    t_extract = time.perf_counter()
 
     # Step 2: Map to Europass format
     europass = map_to_europass(resume, locale=locale, include_photo=include_photo)
+    t_map = time.perf_counter()
+
+    # Normalize the validate flag to a mode. The booleans keep their old
+    # meaning, except that True on the "both" path now checks only JSON:
+    # the XML comes from the same tree, so the XSD traversal adds little.
+    if validate is True:
+        validate_mode = "json" if output_format == "both" else output_format
+    elif validate is False:
+        validate_mode = "none"
+    else:
+        validate_mode = validate
 
-    # Step 3: Generate output
-    result = ConversionResult()
-
-    if output_format in ["json", "both"]:
-        result.json_data = europass.to_json()
-
-    if output_format in ["xml", "both"]:
-        result.xml_data = europass.to_xml()
+    if validate_mode != "none":
+        from eurocv.core.validate.schema_validator import SHARED_VALIDATOR
 
-    # Step 4: Validate if requested
-    if validate:
-        validator = SchemaValidator()
+    # Step 3/4: Generate output and validate if requested.
+    # Single-format calls skip the ConversionResult wrapper entirely: its
+    # errors list is never returned on these paths, so building it is
+    # wasted allocation in batch loops.
+    if output_format == "json":
+        json_data = europass.to_json()
+        if validate_mode in ("json", "both"):
+            SHARED_VALIDATOR.validate_json(json_data)
+        _log_phases(t_start, t_extract, t_map)
+        return json_data or {}
+
+    if output_format == "xml":
+        xml_data = europass.to_xml()
+        if validate_mode in ("xml", "both"):
+            SHARED_VALIDATOR.validate_xml(xml_data)
+        _log_phases(t_start, t_extract, t_map)
+        return xml_data or ""
 
-        if result.json_data:
-            is_valid, errors = validator.validate_json(result.json_data)
+    result = ConversionResult()
+    result.json_data = europass.to_json()
+    result.xml_data = europass.to_xml()
+
+    if validate_mode != "none":
+        # Reuse the shared validator; constructing one per call re-reads
+        # the XSD and rebuilds internal state for no benefit.
+        check_json = bool(result.json_data) and validate_mode in ("json", "both")
+        check_xml = bool(result.xml_data) and validate_mode in ("xml", "both")
+
+        if check_json and check_xml:
+            # Validate both formats concurrently: lxml's XSD validation
+            # releases the GIL, so the two checks overlap on two threads.
+            json_future = _VALIDATION_POOL.submit(
+                SHARED_VALIDATOR.validate_json, result.json_data
+            )
+            xml_future = _VALIDATION_POOL.submit(
+                SHARED_VALIDATOR.validate_xml, result.xml_data
+            )
+            for future in (json_future, xml_future):
+                is_valid, errors = future.result()
+                if not is_valid:
+                    result.validation_errors.extend(errors)
+        elif check_json:
+            is_valid, errors = SHARED_VALIDATOR.validate_json(result.json_data)
             if not is_valid:
                 result.validation_errors.extend(errors)
-
-        if result.xml_data:
-            is_valid, errors = validator.validate_xml(result.xml_data)
+        elif check_xml:
+            is_valid, errors = SHARED_VALIDATOR.validate_xml(result.xml_data)
             if not is_valid:
                 result.validation_errors.extend(errors)
 
-    # Return appropriate format
-    if output_format == "json":
-        return result.json_data or {}
-    elif output_format == "xml":
-        return result.xml_data or ""
-    else:
-        return result
+    _log_phases(t_start, t_extract, t_map)
+    return result
+
 
+def _warm_validator() -> None:
+    """Process-pool initializer: precompile the XSD in each worker."""
+    from eurocv.core.validate.schema_validator import SHARED_VALIDATOR
 
-def extract_resume(file_path: str, use_ocr: bool = False) -> Resume:
+    SHARED_VALIDATOR._get_xmlschema()
+
+
+def convert_many(
+    file_paths: Sequence[Union[str, Path]],
+    max_workers: Optional[int] = None,
+    **kwargs: Any,
+) -> list[Union[dict[str, Any], str, ConversionResult]]:
+    """Convert several resume files concurrently.
+
+    Uses a process pool when use_ocr is set (OCR is pure-Python CPU work
+    that needs to bypass the GIL) and a thread pool otherwise, where the
+    PDF/XML work happens in GIL-releasing C extensions. Results are
+    returned in input order; a failing file raises, as with a plain loop.
+
+    Args:
+        file_paths: Paths to resume files (PDF or DOCX)
+        max_workers: Pool size; defaults to the executor's heuristic
+        **kwargs: Options forwarded to convert_to_europass
+            (locale, include_photo, output_format, use_ocr, validate)
+
+    Returns:
+        One convert_to_europass result per input file, in order
+    """
+    if not file_paths:
+        return []
+
+    convert = functools.partial(convert_to_europass, **kwargs)
+
+    if kwargs.get("use_ocr"):
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_warm_validator
+        ) as executor:
+            return list(executor.map(convert, file_paths))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(convert, file_paths))
+
+
+def extract_resume(
+    file_path: Union[str, BinaryIO],
+    use_ocr: bool = False,
+    filename: Optional[str] = None,
+) -> Resume:
     """Extract resume data from a file using auto-detection.
 
     Automatically selects the appropriate extractor based on file type
     and content. Supports LinkedIn PDFs, generic PDFs, and DOCX files.
 
     Args:
-        file_path: Path to resume file
+        file_path: Path to resume file, or an open binary file-like object
         use_ocr: Use OCR for scanned PDFs
+        filename: Original filename for format detection of file-like input
 
     Returns:
         Resume object
@@ -96,7 +230,20 @@ def extract_resume(file_path: str, use_ocr: bool = False) -> Resume:
     Raises:
         ValueError: If file format is unsupported or no suitable extractor found
     """
-    # Use registry for auto-detection
+    # Use registry for auto-detection. File-like inputs carry their
+    # original filename on .name so suffix-based detection keeps working.
+    if hasattr(file_path, "read"):
+        if filename:
+            try:
+                file_path.name = filename
+            except AttributeError:
+                pass  # Some streams have a read-only name; rely on it instead
+        if not getattr(file_path, "name", ""):
+            raise ValueError(
+                "filename is required to detect the format of file-like input"
+            )
+    from eurocv.core.extract.registry import get_extractor
+
     extractor = get_extractor(file_path, use_ocr=use_ocr)
     return extractor.extract(file_path)
 
@@ -114,8 +261,20 @@ def map_to_europass(
     Returns:
         EuropassCV object
     """
-    mapper = EuropassMapper(locale=locale, include_photo=include_photo)
-    return mapper.map(resume)
+    return _get_mapper(locale, include_photo).map(resume)
+
+
+@functools.lru_cache(maxsize=16)
+def _get_mapper(locale: str, include_photo: bool) -> Any:
+    """Return a shared EuropassMapper for (locale, include_photo).
+
+    The mapper is stateless after construction (map() only reads its
+    lookup tables), so batch conversions with the same settings reuse
+    one instance instead of constructing one per CV.
+    """
+    from eurocv.core.map.europass_mapper import EuropassMapper
+
+    return EuropassMapper(locale=locale, include_photo=include_photo)
 
 
 def validate_europass(data: Union[dict[str, Any], str]) -> tuple[bool, list[str]]:
@@ -127,11 +286,11 @@ def validate_europass(data: Union[dict[str, Any], str]) -> tuple[bool, list[str]
     Returns:
         Tuple of (is_valid, list of errors)
     """
-    validator = SchemaValidator()
+    from eurocv.core.validate.schema_validator import SHARED_VALIDATOR
 
     if isinstance(data, dict):
-        return validator.validate_json(data)
+        return SHARED_VALIDATOR.validate_json(data)
     elif isinstance(data, str):
-        return validator.validate_xml(data)
+        return SHARED_VALIDATOR.validate_xml(data)
     else:
         return False, ["Invalid data type: must be dict (JSON) or str (XML)"]
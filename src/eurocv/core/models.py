@@ -148,8 +148,28 @@ class EuropassCV(BaseModel):
     LearnerInfo: dict[str, Any] = Field(default_factory=dict)
 
     def to_json(self) -> dict[str, Any]:
-        """Convert to JSON dict."""
-        return self.model_dump(exclude_none=True)
+        """Convert to JSON dict.
+
+        Both fields are already plain JSON-safe dicts built by the
+        mapper, so this emits them directly instead of walking the
+        Pydantic serializer (model_dump), which deep-copies the whole
+        tree. Neither field can be None (default_factory=dict), so the
+        old exclude_none had nothing to prune.
+        """
+        return {
+            "DocumentInfo": self.DocumentInfo,
+            "LearnerInfo": self.LearnerInfo,
+        }
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize directly to JSON bytes with orjson.
+
+        Skips the Python-level string building of json.dumps; callers
+        that write to disk or an HTTP response can send the bytes as-is.
+        """
+        import orjson
+
+        return orjson.dumps(self.to_json())
 
     def to_xml(self) -> str:
         """Convert to XML string."""
@@ -158,6 +178,17 @@ class EuropassCV(BaseModel):
 
         return convert_to_xml(self.to_json())
 
+    def to_xml_bytes(self) -> bytes:
+        """Convert to UTF-8 encoded XML bytes.
+
+        lxml emits bytes natively, so this skips the decode that
+        to_xml's str return adds; pair with validate_xml(bytes) to avoid
+        re-encoding as well.
+        """
+        from eurocv.core.validate.schema_validator import convert_to_xml_bytes
+
+        return convert_to_xml_bytes(self.to_json())
+
 
 class ConversionResult(BaseModel):
     """Result of conversion."""
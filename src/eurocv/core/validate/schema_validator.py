@@ -1,16 +1,50 @@
 """Europass schema validation."""
 
+import threading
 from pathlib import Path
-from typing import Any
+from typing import Any, Union
 
 
 class SchemaValidator:
     """Validate Europass JSON/XML against official schemas."""
 
+    # Compiled lxml XMLSchema shared by all instances. XSD compilation
+    # parses the schema and builds its automata (tens of milliseconds),
+    # so it is done once per process, lazily, behind a lock.
+    _compiled_xsd: Any = None
+    _compiled_xsd_error: str = ""
+    _xsd_loaded = False
+    _xsd_lock = threading.Lock()
+
     def __init__(self) -> None:
         """Initialize validator."""
         self.schema_dir = Path(__file__).parent.parent.parent / "schemas"
 
+    def _get_xmlschema(self) -> Any:
+        """Return the compiled XMLSchema, or None if unavailable.
+
+        Compiles the XSD at most once per process; a failed compile is
+        remembered in _compiled_xsd_error instead of being retried.
+        """
+        cls = SchemaValidator
+        if not cls._xsd_loaded:
+            with cls._xsd_lock:
+                if not cls._xsd_loaded:
+                    schema_path = self.schema_dir / "europass_cv_v3.xsd"
+                    if schema_path.exists():
+                        from lxml import etree
+
+                        try:
+                            with open(schema_path, "rb") as f:
+                                schema_doc = etree.parse(f)
+                            cls._compiled_xsd = etree.XMLSchema(schema_doc)
+                        except Exception as e:
+                            cls._compiled_xsd_error = (
+                                f"Schema validation error: {str(e)}"
+                            )
+                    cls._xsd_loaded = True
+        return cls._compiled_xsd
+
     def validate_json(self, data: dict[str, Any]) -> tuple[bool, list[str]]:
         """Validate Europass JSON data.
 
@@ -135,11 +169,18 @@ class SchemaValidator:
 
         return errors
 
-    def validate_xml(self, xml_string: str) -> tuple[bool, list[str]]:
+    def validate_xml(
+        self, xml_string: Union[str, bytes], strict: bool = True
+    ) -> tuple[bool, list[str]]:
         """Validate Europass XML.
 
         Args:
-            xml_string: XML string
+            xml_string: XML document as str, or UTF-8 bytes (avoids an
+                encode pass for callers that already hold bytes)
+            strict: When False, skip the XSD traversal and only check
+                well-formedness and the root element. XML produced by
+                our own emitter from already-validated JSON rarely needs
+                the full schema walk, which dominates validation cost.
 
         Returns:
             Tuple of (is_valid, list of errors)
@@ -151,24 +192,24 @@ class SchemaValidator:
 
             # Parse XML
             try:
-                root = etree.fromstring(xml_string.encode("utf-8"))
+                payload = (
+                    xml_string
+                    if isinstance(xml_string, bytes)
+                    else xml_string.encode("utf-8")
+                )
+                root = etree.fromstring(payload)
             except etree.XMLSyntaxError as e:
                 errors.append(f"XML syntax error: {str(e)}")
                 return False, errors
 
-            # Load schema if available
-            schema_path = self.schema_dir / "europass_cv_v3.xsd"
-            if schema_path.exists():
-                try:
-                    with open(schema_path, "rb") as f:
-                        schema_doc = etree.parse(f)
-                        schema = etree.XMLSchema(schema_doc)
-
-                    if not schema.validate(root):
-                        for error in schema.error_log:
-                            errors.append(f"Line {error.line}: {error.message}")
-                except Exception as e:
-                    errors.append(f"Schema validation error: {str(e)}")
+            # Validate against the precompiled schema if available
+            schema = self._get_xmlschema() if strict else None
+            if schema is not None:
+                if not schema.validate(root):
+                    for error in schema.error_log:
+                        errors.append(f"Line {error.line}: {error.message}")
+            elif strict and SchemaValidator._compiled_xsd_error:
+                errors.append(SchemaValidator._compiled_xsd_error)
             else:
                 # Basic XML structure check
                 if root.tag != "Europass":
@@ -181,6 +222,11 @@ class SchemaValidator:
         return is_valid, errors
 
 
+# Shared instance for hot paths: callers that validate per request should
+# reuse this instead of constructing a fresh SchemaValidator each time.
+SHARED_VALIDATOR = SchemaValidator()
+
+
 def convert_to_xml(data: dict[str, Any]) -> str:
     """Convert Europass JSON to XML format.
 
@@ -190,6 +236,22 @@ def convert_to_xml(data: dict[str, Any]) -> str:
     Returns:
         XML string
     """
+    return convert_to_xml_bytes(data).decode("utf-8")
+
+
+def convert_to_xml_bytes(data: dict[str, Any]) -> bytes:
+    """Convert Europass JSON to UTF-8 encoded XML bytes.
+
+    lxml serializes to bytes natively; callers that write to disk or an
+    HTTP response can use these directly and skip the decode/re-encode
+    round-trip that convert_to_xml's str return forces.
+
+    Args:
+        data: Europass JSON data
+
+    Returns:
+        XML document as UTF-8 bytes
+    """
     try:
         from lxml import etree
 
@@ -213,17 +275,16 @@ def convert_to_xml(data: dict[str, Any]) -> str:
             _dict_to_xml(data["LearnerInfo"], learner_info)
 
         # Pretty print
-        xml_string = etree.tostring(
+        return etree.tostring(
             root, pretty_print=True, xml_declaration=True, encoding="UTF-8"
         )
-        return xml_string.decode("utf-8")
 
     except ImportError:
         # Fallback to simple XML generation
         import xmltodict
 
         xml_dict = {"Europass": data}
-        return xmltodict.unparse(xml_dict, pretty=True)
+        return xmltodict.unparse(xml_dict, pretty=True).encode("utf-8")
 
 
 def _dict_to_xml(data: Any, parent: Any) -> None:
@@ -270,3 +270,52 @@ def test_extract_resume_with_ocr(mock_exists, mock_extract):
 
     # Should extract and return Resume
     assert isinstance(resume, Resume)
+
+
+@patch("eurocv.core.extract.generic_pdf_extractor.GenericPDFExtractor.extract")
+@patch("pathlib.Path.exists", return_value=True)
+def test_convert_many(mock_exists, mock_extract):
+    """Test concurrent batch conversion preserves input order."""
+    from eurocv.core.converter import convert_many
+
+    mock_extract.return_value = Resume(
+        personal_info=PersonalInfo(first_name="Test", last_name="User")
+    )
+
+    results = convert_many(
+        ["a.pdf", "b.pdf", "c.pdf"], output_format="json", validate=False
+    )
+
+    assert len(results) == 3
+    assert all(isinstance(result, dict) for result in results)
+    assert mock_extract.call_count == 3
+
+
+def test_convert_many_empty():
+    """Test convert_many with no files."""
+    from eurocv.core.converter import convert_many
+
+    assert convert_many([]) == []
+
+
+@patch("eurocv.core.extract.generic_pdf_extractor.GenericPDFExtractor.extract")
+@patch("eurocv.core.validate.schema_validator.SchemaValidator.validate_xml")
+@patch("pathlib.Path.exists", return_value=True)
+def test_convert_to_europass_validate_mode_both(
+    mock_exists, mock_validate_xml, mock_extract
+):
+    """Test that validate="both" still runs the XSD check."""
+    mock_extract.return_value = Resume(
+        personal_info=PersonalInfo(first_name="Test", last_name="User")
+    )
+    mock_validate_xml.return_value = (False, ["XML validation error"])
+
+    result = convert_to_europass("test.pdf", output_format="both", validate="both")
+
+    assert isinstance(result, ConversionResult)
+    assert "XML validation error" in result.validation_errors
+
+    # Default validate=True skips the XSD pass on the "both" output path
+    mock_validate_xml.reset_mock()
+    convert_to_europass("test.pdf", output_format="both", validate=True)
+    mock_validate_xml.assert_not_called()
@@ -1683,3 +1683,63 @@ January 2020 - Present"""
     assert work_exp[0].employer == "Tech Company"
     # Description might be None or empty
     assert work_exp[0].description is None or work_exp[0].description == ""
+
+
+def test_docx_extractor_extract_many(tmp_path):
+    """Test parallel batch extraction of several DOCX files."""
+    from docx import Document as DocxDocument
+
+    paths = []
+    for name in ("Alice Smith", "Bob Jones"):
+        doc = DocxDocument()
+        doc.add_paragraph(name)
+        doc.add_paragraph("Software Engineer")
+        path = tmp_path / f"{name.split()[0].lower()}.docx"
+        doc.save(str(path))
+        paths.append(path)
+
+    resumes = DOCXExtractor.extract_many(paths)
+
+    assert len(resumes) == 2
+    # Results come back in input order
+    assert resumes[0].personal_info.first_name == "Alice"
+    assert resumes[1].personal_info.first_name == "Bob"
+
+
+def test_docx_extractor_extract_many_empty():
+    """Test batch extraction with no input files."""
+    assert DOCXExtractor.extract_many([]) == []
+
+
+def test_generic_pdf_extractor_extract_many(tmp_path):
+    """Test parallel batch extraction of several PDF files."""
+    import fitz
+
+    from eurocv.core.extract.generic_pdf_extractor import GenericPDFExtractor
+
+    paths = []
+    for name in ("Megan Brown", "Steven Clark"):
+        doc = fitz.open()
+        page = doc.new_page()
+        page.insert_text((72, 72), name)
+        page.insert_text((72, 100), "Software Engineer")
+        page.insert_text((72, 128), f"{name.split()[0].lower()}@example.com")
+        path = tmp_path / f"{name.split()[0].lower()}.pdf"
+        doc.save(str(path))
+        doc.close()
+        paths.append(path)
+
+    resumes = GenericPDFExtractor.extract_many(paths)
+
+    assert len(resumes) == 2
+    # Results come back in input order
+    assert resumes[0].personal_info.first_name == "Megan"
+    assert resumes[1].personal_info.first_name == "Steven"
+    assert resumes[0].personal_info.email == "megan@example.com"
+
+
+def test_generic_pdf_extractor_extract_many_empty():
+    """Test batch extraction with no input files."""
+    from eurocv.core.extract.generic_pdf_extractor import GenericPDFExtractor
+
+    assert GenericPDFExtractor.extract_many([]) == []
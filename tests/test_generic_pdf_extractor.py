@@ -703,7 +703,7 @@ def test_extract_with_pdfminer_fallback(mock_fitz_open, extractor, tmp_path):
 
     # Mock pdfminer
     with patch(
-        "eurocv.core.extract.generic_pdf_extractor.pdfminer_extract_text"
+        "pdfminer.high_level.extract_text"
     ) as mock_pdfminer:
         mock_pdfminer.return_value = "Test text from pdfminer"
 
@@ -1271,7 +1271,10 @@ def test_ocr_success_path(extractor):
 
     mock_page = MagicMock()
     mock_pixmap = MagicMock()
-    mock_pixmap.tobytes.return_value = b"fake_image_data"
+    mock_pixmap.alpha = False
+    mock_pixmap.width = 100
+    mock_pixmap.height = 50
+    mock_pixmap.samples = b"fake_image_data"
     mock_page.get_pixmap.return_value = mock_pixmap
 
     # Create mock modules for PIL and pytesseract
@@ -1280,7 +1283,7 @@ def test_ocr_success_path(extractor):
     mock_pytesseract = MagicMock()
 
     mock_image = MagicMock()
-    mock_image_module.open.return_value = mock_image
+    mock_image_module.frombuffer.return_value = mock_image
     mock_pil.Image = mock_image_module
     mock_pytesseract.image_to_string.return_value = "OCR Text Result"
 
@@ -1297,7 +1300,11 @@ def test_ocr_success_path(extractor):
 
         assert result == "OCR Text Result"
         mock_page.get_pixmap.assert_called_once_with(dpi=300)
-        mock_pixmap.tobytes.assert_called_once_with("png")
+        # Image built directly from raw samples, no PNG roundtrip
+        mock_image_module.frombuffer.assert_called_once_with(
+            "RGB", (100, 50), b"fake_image_data"
+        )
+        mock_pixmap.tobytes.assert_not_called()
     finally:
         # Restore original modules
         if original_pil is None: